@@ -1,7 +1,30 @@
 import numpy as np
 import warnings
 
-from scipy.stats import norm
+from scipy.special import ndtr
+
+
+_INV_SQRT_2PI = 1.0 / np.sqrt(2.0 * np.pi)
+
+
+def _norm_pdf(z):
+    """Standard normal density, as a plain ufunc expression.
+
+    Equal to `scipy.stats.norm.pdf(z)` without the overhead of the frozen
+    distribution. The standard normal distribution function is
+    `scipy.special.ndtr`.
+    """
+    pdf = np.square(z)
+    pdf *= -0.5
+    np.exp(pdf, out=pdf)
+    pdf *= _INV_SQRT_2PI
+    return pdf
+
+
+def _as_float_array(a):
+    """Return `a` as a contiguous float64 array, as the compiled
+    acquisition functions expect."""
+    return np.ascontiguousarray(a, dtype=np.float64)
 
 
 def gaussian_acquisition_1D(X, model, y_opt=None, acq_func="LCB",
@@ -33,6 +56,7 @@ def _gaussian_acquisition(X, model, y_opt=None, acq_func="LCB",
         acq_func_kwargs = dict()
     xi = acq_func_kwargs.get("xi", 0.01)
     kappa = acq_func_kwargs.get("kappa", 1.96)
+    use_numba = acq_func_kwargs.get("use_numba", False)
 
     # Evaluate acquisition function
     per_second = acq_func.endswith("ps")
@@ -40,7 +64,8 @@ def _gaussian_acquisition(X, model, y_opt=None, acq_func="LCB",
         model, time_model = model.estimators_
 
     if acq_func == "LCB":
-        func_and_grad = gaussian_lcb(X, model, kappa, return_grad)
+        func_and_grad = gaussian_lcb(X, model, kappa, return_grad,
+                                     use_numba=use_numba)
         if return_grad:
             acq_vals, acq_grad = func_and_grad
         else:
@@ -48,9 +73,11 @@ def _gaussian_acquisition(X, model, y_opt=None, acq_func="LCB",
 
     elif acq_func in ["EI", "PI", "EIps", "PIps"]:
         if acq_func in ["EI", "EIps"]:
-            func_and_grad = gaussian_ei(X, model, y_opt, xi, return_grad)
+            func_and_grad = gaussian_ei(X, model, y_opt, xi, return_grad,
+                                        use_numba=use_numba)
         else:
-            func_and_grad = gaussian_pi(X, model, y_opt, xi, return_grad)
+            func_and_grad = gaussian_pi(X, model, y_opt, xi, return_grad,
+                                        use_numba=use_numba)
 
         if return_grad:
             acq_vals = -func_and_grad[0]
@@ -87,7 +114,90 @@ def _gaussian_acquisition(X, model, y_opt=None, acq_func="LCB",
     return acq_vals
 
 
-def gaussian_lcb(X, model, kappa=1.96, return_grad=False):
+def _gaussian_acquisition_from_moments(mu, std, y_opt=None, acq_func="LCB",
+                                       acq_func_kwargs=None):
+    """
+    Same as `_gaussian_acquisition` without gradients, for a posterior mean
+    `mu` and standard deviation `std` that have already been predicted.
+
+    This allows several acquisition functions to be evaluated on the same
+    points with a single call to `model.predict`. The per-second variants
+    need a time model and are not supported.
+    """
+    if acq_func_kwargs is None:
+        acq_func_kwargs = dict()
+    xi = acq_func_kwargs.get("xi", 0.01)
+    kappa = acq_func_kwargs.get("kappa", 1.96)
+    use_numba = acq_func_kwargs.get("use_numba", False)
+
+    if acq_func == "LCB":
+        return _lcb(mu, std, kappa, use_numba)
+    elif acq_func == "EI":
+        return -_ei(mu, std, y_opt, xi, use_numba)
+    elif acq_func == "PI":
+        return -_pi(mu, std, y_opt, xi, use_numba)
+    else:
+        raise ValueError("Acquisition function not implemented.")
+
+
+def _check_moments(mu, std):
+    # check dimensionality of mu, std so we can divide them below
+    if (mu.ndim != 1) or (std.ndim != 1):
+        raise ValueError("mu and std are {}-dimensional and {}-dimensional, "
+                         "however both must be 1-dimensional. Did you train "
+                         "your model with an (N, 1) vector instead of an "
+                         "(N,) vector?"
+                         .format(mu.ndim, std.ndim))
+
+
+def _lcb(mu, std, kappa, use_numba=False):
+    """LCB values for given posterior means and deviations."""
+    if kappa == "inf":
+        return -std
+    if use_numba:
+        from .acquisition_numba import _lcb as _lcb_numba
+        return _lcb_numba(_as_float_array(mu), _as_float_array(std),
+                          float(kappa))
+    return mu - kappa * std
+
+
+def _pi(mu, std, y_opt, xi, use_numba=False):
+    """PI values for given posterior means and deviations."""
+    _check_moments(mu, std)
+    if use_numba:
+        from .acquisition_numba import _pi as _pi_numba
+        return _pi_numba(_as_float_array(mu), _as_float_array(std),
+                         float(y_opt), float(xi))
+
+    values = np.zeros_like(mu)
+    mask = std > 0
+    values[mask] = ndtr((y_opt - xi - mu[mask]) / std[mask])
+    return values
+
+
+def _ei(mu, std, y_opt, xi, use_numba=False):
+    """EI values for given posterior means and deviations."""
+    _check_moments(mu, std)
+    if use_numba:
+        from .acquisition_numba import _ei as _ei_numba
+        return _ei_numba(_as_float_array(mu), _as_float_array(std),
+                         float(y_opt), float(xi))
+
+    values = np.zeros_like(mu)
+    mask = std > 0
+    std = std[mask]
+    improve = y_opt - xi - mu[mask]
+    scaled = improve / std
+    exploit = ndtr(scaled)
+    exploit *= improve
+    explore = _norm_pdf(scaled)
+    explore *= std
+    exploit += explore
+    values[mask] = exploit
+    return values
+
+
+def gaussian_lcb(X, model, kappa=1.96, return_grad=False, use_numba=False):
     """
     Use the lower confidence bound to estimate the acquisition
     values.
@@ -118,6 +228,11 @@ def gaussian_lcb(X, model, kappa=1.96, return_grad=False):
         Whether or not to return the grad. Implemented only for the case where
         ``X`` is a single sample.
 
+    * `use_numba`: [boolean, default=False]:
+        Whether to compute the values with the numba-compiled version in
+        `ProcessOptimizer.acquisition_numba`. Requires numba. Ignored when
+        ``return_grad`` is True.
+
     Returns
     -------
     * `values`: [array-like, shape=(X.shape[0],)]:
@@ -141,12 +256,11 @@ def gaussian_lcb(X, model, kappa=1.96, return_grad=False):
 
         else:
             mu, std = model.predict(X, return_std=True)
-            if kappa == "inf":
-                return -std
-            return mu - kappa * std
+            return _lcb(mu, std, kappa, use_numba)
 
 
-def gaussian_pi(X, model, y_opt=0.0, xi=0.01, return_grad=False):
+def gaussian_pi(X, model, y_opt=0.0, xi=0.01, return_grad=False,
+                use_numba=False):
     """
     Use the probability of improvement to calculate the acquisition values.
 
@@ -186,6 +300,11 @@ def gaussian_pi(X, model, y_opt=0.0, xi=0.01, return_grad=False):
         Whether or not to return the grad. Implemented only for the case where
         ``X`` is a single sample.
 
+    * `use_numba`: [boolean, default=False]:
+        Whether to compute the values with the numba-compiled version in
+        `ProcessOptimizer.acquisition_numba`. Requires numba. Ignored when
+        ``return_grad`` is True.
+
     Returns
     -------
     * `values`: [array-like, shape=(X.shape[0],)]:
@@ -201,19 +320,16 @@ def gaussian_pi(X, model, y_opt=0.0, xi=0.01, return_grad=False):
         else:
             mu, std = model.predict(X, return_std=True)
 
-    # check dimensionality of mu, std so we can divide them below
-    if (mu.ndim != 1) or (std.ndim != 1):
-        raise ValueError("mu and std are {}-dimensional and {}-dimensional, "
-                         "however both must be 1-dimensional. Did you train "
-                         "your model with an (N, 1) vector instead of an "
-                         "(N,) vector?"
-                         .format(mu.ndim, std.ndim))
+    if not return_grad:
+        return _pi(mu, std, y_opt, xi, use_numba)
+
+    _check_moments(mu, std)
 
     values = np.zeros_like(mu)
     mask = std > 0
     improve = y_opt - xi - mu[mask]
     scaled = improve / std[mask]
-    values[mask] = norm.cdf(scaled)
+    values[mask] = ndtr(scaled)
 
     if return_grad:
         if not np.all(mask):
@@ -224,12 +340,13 @@ def gaussian_pi(X, model, y_opt=0.0, xi=0.01, return_grad=False):
         improve_grad = -mu_grad * std - std_grad * improve
         improve_grad /= std**2
 
-        return values, improve_grad * norm.pdf(scaled)
+        return values, improve_grad * _norm_pdf(scaled)
 
     return values
 
 
-def gaussian_ei(X, model, y_opt=0.0, xi=0.01, return_grad=False):
+def gaussian_ei(X, model, y_opt=0.0, xi=0.01, return_grad=False,
+                use_numba=False):
     """
     Use the expected improvement to calculate the acquisition values.
 
@@ -268,6 +385,11 @@ def gaussian_ei(X, model, y_opt=0.0, xi=0.01, return_grad=False):
         Whether or not to return the grad. Implemented only for the case where
         ``X`` is a single sample.
 
+    * `use_numba`: [boolean, default=False]:
+        Whether to compute the values with the numba-compiled version in
+        `ProcessOptimizer.acquisition_numba`. Requires numba. Ignored when
+        ``return_grad`` is True.
+
     Returns
     -------
     * `values`: [array-like, shape=(X.shape[0],)]:
@@ -284,20 +406,17 @@ def gaussian_ei(X, model, y_opt=0.0, xi=0.01, return_grad=False):
         else:
             mu, std = model.predict(X, return_std=True)
 
-    # check dimensionality of mu, std so we can divide them below
-    if (mu.ndim != 1) or (std.ndim != 1):
-        raise ValueError("mu and std are {}-dimensional and {}-dimensional, "
-                         "however both must be 1-dimensional. Did you train "
-                         "your model with an (N, 1) vector instead of an "
-                         "(N,) vector?"
-                         .format(mu.ndim, std.ndim))
+    if not return_grad:
+        return _ei(mu, std, y_opt, xi, use_numba)
+
+    _check_moments(mu, std)
 
     values = np.zeros_like(mu)
     mask = std > 0
     improve = y_opt - xi - mu[mask]
     scaled = improve / std[mask]
-    cdf = norm.cdf(scaled)
-    pdf = norm.pdf(scaled)
+    cdf = ndtr(scaled)
+    pdf = _norm_pdf(scaled)
     exploit = improve * cdf
     explore = std[mask] * pdf
     values[mask] = exploit + explore
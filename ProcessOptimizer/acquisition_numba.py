@@ -0,0 +1,151 @@
+"""
+Compiled versions of the acquisition functions.
+
+The functions in `ProcessOptimizer.acquisition` evaluate the acquisition
+function through a chain of NumPy operations, each of which allocates a
+temporary array of the same size as the number of candidate points. The
+versions in this module compute the acquisition value of each point in a
+single fused loop, compiled with numba and run in parallel over the
+points.
+
+The parallel loop is only entered from the main thread. numba's default
+threading layer aborts the process when a parallel region is entered
+from several threads at once, as the restarts of the lbfgs acquisition
+optimizer would do. Other threads, and single points, use the serial
+loop.
+
+numba is an optional dependency. This module is only imported when the
+acquisition function is called with `use_numba=True` in `acq_func_kwargs`.
+"""
+import math
+import threading
+
+import numpy as np
+
+from numba import njit
+from numba import prange
+
+
+_SQRT_2 = math.sqrt(2.0)
+_INV_SQRT_2PI = 1.0 / math.sqrt(2.0 * math.pi)
+
+
+@njit(fastmath=True, cache=True)
+def _ei_value(mu, std, y_opt, xi):
+    """Expected improvement of a single point."""
+    if std <= 0:
+        return 0.0
+    improve = y_opt - xi - mu
+    z = improve / std
+    cdf = 0.5 * (1.0 + math.erf(z / _SQRT_2))
+    pdf = _INV_SQRT_2PI * math.exp(-0.5 * z * z)
+    return improve * cdf + std * pdf
+
+
+@njit(fastmath=True, cache=True)
+def _pi_value(mu, std, y_opt, xi):
+    """Probability of improvement of a single point."""
+    if std <= 0:
+        return 0.0
+    z = (y_opt - xi - mu) / std
+    return 0.5 * (1.0 + math.erf(z / _SQRT_2))
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def _ei_parallel(mu, std, y_opt, xi):
+    """Expected improvement, in parallel over the points."""
+    values = np.empty(mu.shape[0])
+    for i in prange(mu.shape[0]):
+        values[i] = _ei_value(mu[i], std[i], y_opt, xi)
+    return values
+
+
+@njit(fastmath=True, cache=True)
+def _ei_serial(mu, std, y_opt, xi):
+    """Expected improvement, without threads."""
+    values = np.empty(mu.shape[0])
+    for i in range(mu.shape[0]):
+        values[i] = _ei_value(mu[i], std[i], y_opt, xi)
+    return values
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def _pi_parallel(mu, std, y_opt, xi):
+    """Probability of improvement, in parallel over the points."""
+    values = np.empty(mu.shape[0])
+    for i in prange(mu.shape[0]):
+        values[i] = _pi_value(mu[i], std[i], y_opt, xi)
+    return values
+
+
+@njit(fastmath=True, cache=True)
+def _pi_serial(mu, std, y_opt, xi):
+    """Probability of improvement, without threads."""
+    values = np.empty(mu.shape[0])
+    for i in range(mu.shape[0]):
+        values[i] = _pi_value(mu[i], std[i], y_opt, xi)
+    return values
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def _lcb_parallel(mu, std, kappa):
+    """Lower confidence bound, in parallel over the points."""
+    values = np.empty(mu.shape[0])
+    for i in prange(mu.shape[0]):
+        values[i] = mu[i] - kappa * std[i]
+    return values
+
+
+@njit(fastmath=True, cache=True)
+def _lcb_serial(mu, std, kappa):
+    """Lower confidence bound, without threads."""
+    values = np.empty(mu.shape[0])
+    for i in range(mu.shape[0]):
+        values[i] = mu[i] - kappa * std[i]
+    return values
+
+
+def _use_parallel(mu):
+    """Whether the parallel loop can be entered for `mu`."""
+    return (mu.shape[0] > 1
+            and threading.current_thread() is threading.main_thread())
+
+
+def _ei(mu, std, y_opt, xi):
+    """Expected improvement for given posterior means and deviations."""
+    if _use_parallel(mu):
+        return _ei_parallel(mu, std, y_opt, xi)
+    return _ei_serial(mu, std, y_opt, xi)
+
+
+def _pi(mu, std, y_opt, xi):
+    """Probability of improvement for given posterior means and deviations.
+    """
+    if _use_parallel(mu):
+        return _pi_parallel(mu, std, y_opt, xi)
+    return _pi_serial(mu, std, y_opt, xi)
+
+
+def _lcb(mu, std, kappa):
+    """Lower confidence bound for given posterior means and deviations."""
+    if _use_parallel(mu):
+        return _lcb_parallel(mu, std, kappa)
+    return _lcb_serial(mu, std, kappa)
+
+
+def _warm_up():
+    """Compile the functions on a single point.
+
+    Compilation happens on the first call and can take several seconds, so
+    it is done once at import instead of during the first optimization
+    step. With `cache=True` later imports load the compiled code from disk.
+    """
+    mu = np.zeros(1)
+    std = np.ones(1)
+    for ei_pi in [_ei_parallel, _ei_serial, _pi_parallel, _pi_serial]:
+        ei_pi(mu, std, 0.0, 0.01)
+    _lcb_parallel(mu, std, 1.96)
+    _lcb_serial(mu, std, 1.96)
+
+
+_warm_up()
@@ -0,0 +1,178 @@
+"""
+Compiled evaluation of the kernel between query and training points.
+
+`GaussianProcessRegressor.predict` spends most of its time evaluating the
+kernel between the query points and the training points. The scikit-learn
+kernels do this through `cdist` followed by several NumPy operations, each
+of which allocates a temporary array of shape (n_query, n_train). The
+functions in this module compute each kernel value in a single fused loop,
+compiled with numba and run in parallel over the query points.
+
+Only the kernels used by `cook_estimator` are covered: a `Matern` (with
+`nu` in 0.5, 1.5, 2.5 or inf) or `RBF` kernel, optionally scaled by a
+`ConstantKernel` and with a `WhiteKernel` added. For any other kernel
+`specialized_kernel_params` returns None and the kernel itself is used.
+
+The parallel loop is only entered from the main thread. numba's default
+threading layer aborts the process when a parallel region is entered
+from several threads at once, as the restarts of the lbfgs acquisition
+optimizer would do. Other threads, and single query points, use the
+serial loop.
+
+numba is an optional dependency. This module is only imported when the
+regressor is created with `use_numba=True`.
+"""
+import math
+import threading
+
+import numpy as np
+
+from numba import njit
+from numba import prange
+
+from .kernels import ConstantKernel
+from .kernels import Matern
+from .kernels import Product
+from .kernels import RBF
+from .kernels import Sum
+from .kernels import WhiteKernel
+
+
+_SQRT_3 = math.sqrt(3.0)
+_SQRT_5 = math.sqrt(5.0)
+
+
+@njit(fastmath=True, cache=True)
+def _matern_row(x, Y, constant, nu, K_row):
+    """Matern kernel between `x` and the rows of `Y`, which are already
+    divided by the length scales, written to `K_row`. `nu=inf` gives the
+    RBF kernel."""
+    for j in range(Y.shape[0]):
+        sq_dist = 0.0
+        for k in range(x.shape[0]):
+            diff = x[k] - Y[j, k]
+            sq_dist += diff * diff
+        if nu == 0.5:
+            value = math.exp(-math.sqrt(sq_dist))
+        elif nu == 1.5:
+            scaled = _SQRT_3 * math.sqrt(sq_dist)
+            value = (1.0 + scaled) * math.exp(-scaled)
+        elif nu == 2.5:
+            scaled = _SQRT_5 * math.sqrt(sq_dist)
+            value = (1.0 + scaled + scaled * scaled / 3.0) \
+                * math.exp(-scaled)
+        else:
+            value = math.exp(-0.5 * sq_dist)
+        K_row[j] = constant * value
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def _matern_cross(X, Y, constant, nu):
+    """Matern kernel between the rows of `X` and `Y`, in parallel over the
+    rows of `X`."""
+    K = np.empty((X.shape[0], Y.shape[0]))
+    for i in prange(X.shape[0]):
+        _matern_row(X[i], Y, constant, nu, K[i])
+    return K
+
+
+@njit(fastmath=True, cache=True)
+def _matern_cross_serial(X, Y, constant, nu):
+    """Matern kernel between the rows of `X` and `Y`, without threads."""
+    K = np.empty((X.shape[0], Y.shape[0]))
+    for i in range(X.shape[0]):
+        _matern_row(X[i], Y, constant, nu, K[i])
+    return K
+
+
+def _warm_up():
+    """Compile the functions on a single point.
+
+    Compilation happens on the first call and can take several seconds, so
+    it is done once at import instead of during the first prediction. With
+    `cache=True` later imports load the compiled code from disk.
+    """
+    X = np.zeros((1, 1))
+    _matern_cross(X, X, 1.0, 2.5)
+    _matern_cross_serial(X, X, 1.0, 2.5)
+
+
+_warm_up()
+
+
+def specialized_kernel_params(kernel):
+    """
+    Return the parameters of `kernel` needed by `specialized_kernel`, if
+    `kernel` is supported.
+
+    The parameters are plain values, so that a regressor storing them can
+    still be pickled.
+
+    Parameters
+    ----------
+    * `kernel` [kernel object]:
+        A fitted kernel, typically `GaussianProcessRegressor.kernel_`.
+
+    Returns
+    -------
+    * `params` [tuple or None]:
+        The length scales, the constant and `nu` of the kernel, with
+        `nu=inf` for the RBF kernel. None if the kernel is not supported.
+    """
+    # A WhiteKernel does not contribute to the kernel between different
+    # sets of points
+    if isinstance(kernel, Sum):
+        if isinstance(kernel.k2, WhiteKernel):
+            kernel = kernel.k1
+        elif isinstance(kernel.k1, WhiteKernel):
+            kernel = kernel.k2
+        else:
+            return None
+
+    constant = 1.0
+    if isinstance(kernel, Product):
+        if isinstance(kernel.k1, ConstantKernel):
+            constant, kernel = kernel.k1.constant_value, kernel.k2
+        elif isinstance(kernel.k2, ConstantKernel):
+            constant, kernel = kernel.k2.constant_value, kernel.k1
+        else:
+            return None
+
+    if isinstance(kernel, Matern) and kernel.nu in (0.5, 1.5, 2.5, np.inf):
+        nu = float(kernel.nu)
+    elif isinstance(kernel, RBF):
+        nu = np.inf
+    else:
+        return None
+
+    length_scale = np.asarray(kernel.length_scale, dtype=np.float64)
+    return length_scale, float(constant), nu
+
+
+def specialized_kernel(X, Y, params):
+    """
+    Evaluate the kernel described by `params` between `X` and `Y`.
+
+    Parameters
+    ----------
+    * `X` [array-like, shape=(n_X, n_features)]:
+        Left argument of the kernel.
+
+    * `Y` [array-like, shape=(n_Y, n_features)]:
+        Right argument of the kernel.
+
+    * `params` [tuple]:
+        Parameters returned by `specialized_kernel_params`.
+
+    Returns
+    -------
+    * `K` [array, shape=(n_X, n_Y)]:
+        The kernel matrix.
+    """
+    length_scale, constant, nu = params
+    X = np.ascontiguousarray(X / length_scale, dtype=np.float64)
+    Y = np.ascontiguousarray(Y / length_scale, dtype=np.float64)
+    if (X.shape[0] > 1
+            and threading.current_thread() is threading.main_thread()):
+        return _matern_cross(X, Y, constant, nu)
+    return _matern_cross_serial(X, Y, constant, nu)
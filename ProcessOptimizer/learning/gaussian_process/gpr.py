@@ -2,6 +2,7 @@ import numpy as np
 import warnings
 
 from scipy.linalg import cho_solve
+from scipy.linalg import cholesky
 from scipy.linalg import solve_triangular
 
 import sklearn
@@ -132,6 +133,31 @@ class GaussianProcessRegressor(sk_GaussianProcessRegressor):
         If set to "gaussian", then it is assumed that `y` is a noisy
         estimate of `f(x)` where the noise is gaussian.
 
+    * `incremental` [bool, optional (default: False)]:
+        If True, and the model is fitted again on the previous training
+        points with new points appended, the Cholesky factor and the
+        inverse of the kernel matrix are extended with the new points in
+        O(n_samples^2) instead of being recomputed in O(n_samples^3). This
+        only applies when the kernel hyperparameters are kept fixed, i.e.
+        when `optimizer` is None or on the fits skipped by
+        `hyperparam_refit_every`. Otherwise the model is fitted from
+        scratch as usual.
+
+    * `use_numba` [bool, optional (default: False)]:
+        If True, the kernel between the query points and the training
+        points in `predict` is evaluated with the compiled functions in
+        `gp_specialize`, when the fitted kernel is one of the kernels made
+        by `cook_estimator`. Requires numba. The first use compiles the
+        functions, which takes a few seconds.
+
+    * `hyperparam_refit_every` [int, optional (default: 1)]:
+        Only optimize the kernel hyperparameters on every
+        `hyperparam_refit_every`-th call to `fit`. The other fits keep the
+        hyperparameters of the previous fit, which skips the optimization
+        of the log-marginal-likelihood, the dominant cost of fitting, and
+        lets `incremental` extend the previous fit. The first fit always
+        optimizes the hyperparameters.
+
     Attributes
     ----------
     * `X_train_` [array-like, shape = (n_samples, n_features)]:
@@ -160,8 +186,12 @@ class GaussianProcessRegressor(sk_GaussianProcessRegressor):
     def __init__(self, kernel=None, alpha=1e-10,
                  optimizer="fmin_l_bfgs_b", n_restarts_optimizer=0,
                  normalize_y=False, copy_X_train=True, random_state=None,
-                 noise=None):
+                 noise=None, incremental=False,
+                 use_numba=False, hyperparam_refit_every=1):
         self.noise = noise
+        self.incremental = incremental
+        self.use_numba = use_numba
+        self.hyperparam_refit_every = hyperparam_refit_every
         super(GaussianProcessRegressor, self).__init__(
             kernel=kernel, alpha=alpha, optimizer=optimizer,
             n_restarts_optimizer=n_restarts_optimizer,
@@ -188,16 +218,42 @@ class GaussianProcessRegressor(sk_GaussianProcessRegressor):
             raise ValueError("expected noise to be 'gaussian', got %s"
                              % self.noise)
 
+        n_fits = getattr(self, "_n_fits", 0)
+        hold_theta = (hasattr(self, "_kernel_train")
+                      and n_fits % self.hyperparam_refit_every != 0)
+        self._n_fits = n_fits + 1
+
+        if (self.incremental
+                and (hold_theta or self.optimizer is None)
+                and self._is_extension(X, y)):
+            return self._fit_incremental(X, y)
+
         if self.kernel is None:
             self.kernel = ConstantKernel(1.0, constant_value_bounds="fixed") \
                           * RBF(1.0, length_scale_bounds="fixed")
-        if self.noise == "gaussian":
+        # The noise is added to the kernel only for the duration of the fit,
+        # so that fitting the same instance again does not add it twice
+        kernel = self.kernel
+        optimizer = self.optimizer
+        if hold_theta:
+            # The kernel of the previous fit already includes the noise
+            self.kernel = self._kernel_train
+            self.optimizer = None
+        elif self.noise == "gaussian":
             self.kernel = self.kernel + WhiteKernel()
         elif self.noise:
             self.kernel = self.kernel + WhiteKernel(
                 noise_level=self.noise, noise_level_bounds="fixed"
             )
-        super(GaussianProcessRegressor, self).fit(X, y)
+        try:
+            super(GaussianProcessRegressor, self).fit(X, y)
+        finally:
+            self.kernel = kernel
+            self.optimizer = optimizer
+
+        # The kernel of the training points, with noise, for extending the
+        # fit with new points
+        self._kernel_train = self.kernel_.clone_with_theta(self.kernel_.theta)
 
         self.noise_ = None
 
@@ -225,6 +281,11 @@ class GaussianProcessRegressor(sk_GaussianProcessRegressor):
                         **{white_param: WhiteKernel(noise_level=0.0)})
 
         # Precompute arrays needed at prediction
+        self._kernel_cross_params = None
+        if self.use_numba:
+            from .gp_specialize import specialized_kernel_params
+            self._kernel_cross_params = specialized_kernel_params(
+                self.kernel_)
         L_inv = solve_triangular(self.L_.T, np.eye(self.L_.shape[0]))
         self.K_inv_ = L_inv.dot(L_inv.T)
 
@@ -246,6 +307,74 @@ class GaussianProcessRegressor(sk_GaussianProcessRegressor):
 
         return self
 
+    def _is_extension(self, X, y):
+        """Whether `X` is the current training data with points appended,
+        and the fit can be extended to them."""
+        if np.iterable(self.alpha) or not hasattr(self, "_kernel_train"):
+            return False
+        X = np.asarray(X)
+        n_train = self.X_train_.shape[0]
+        return (X.ndim == 2 and np.ndim(y) == 1
+                and X.shape[1] == self.X_train_.shape[1]
+                and X.shape[0] > n_train
+                and np.array_equal(X[:n_train], self.X_train_))
+
+    def _fit_incremental(self, X, y):
+        """Extend the fit with the points in `X` that are not in `X_train_`.
+
+        With the kernel matrix of the training points K = L L^T, and the
+        new points added as the blocks K_12 and K_22, the Cholesky factor
+        and the inverse are extended by block elimination with the Schur
+        complement S = K_22 - K_12^T K^-1 K_12. The hyperparameters are
+        not changed.
+        """
+        X = check_array(X)
+        y = np.asarray(y, dtype=np.float64)
+        n_train = self.X_train_.shape[0]
+        X_new = X[n_train:]
+
+        K_12 = self._kernel_train(self.X_train_, X_new)
+        K_22 = self._kernel_train(X_new)
+        K_22[np.diag_indices_from(K_22)] += self.alpha
+
+        L_12 = solve_triangular(self.L_, K_12, lower=True)
+        L_22 = cholesky(K_22 - L_12.T.dot(L_12), lower=True)
+        L = np.zeros((X.shape[0], X.shape[0]))
+        L[:n_train, :n_train] = self.L_
+        L[n_train:, :n_train] = L_12.T
+        L[n_train:, n_train:] = L_22
+        self.L_ = L
+
+        C = self.K_inv_.dot(K_12)
+        S_inv = cho_solve((L_22, True), np.eye(X_new.shape[0]))
+        C_S_inv = C.dot(S_inv)
+        K_inv = np.empty_like(L)
+        K_inv[:n_train, :n_train] = self.K_inv_ + C_S_inv.dot(C.T)
+        K_inv[:n_train, n_train:] = -C_S_inv
+        K_inv[n_train:, :n_train] = -C_S_inv.T
+        K_inv[n_train:, n_train:] = S_inv
+        self.K_inv_ = K_inv
+
+        if self.normalize_y:
+            self.y_train_mean_ = np.mean(y, axis=0)
+            self.y_train_std_ = _handle_zeros_in_scale(
+                np.std(y, axis=0), copy=False)
+            y = (y - self.y_train_mean_) / self.y_train_std_
+        else:
+            self.y_train_mean_ = np.zeros(1)
+            self.y_train_std_ = 1
+        self._y_train_mean = self.y_train_mean_
+        self._y_train_std = self.y_train_std_
+
+        self.X_train_ = np.copy(X) if self.copy_X_train else X
+        self.y_train_ = y
+        self.alpha_ = cho_solve((self.L_, True), self.y_train_)
+        self.log_marginal_likelihood_value_ = (
+            -0.5 * self.y_train_.dot(self.alpha_)
+            - np.log(np.diag(self.L_)).sum()
+            - 0.5 * X.shape[0] * np.log(2 * np.pi))
+        return self
+
     def predict(self, X, return_std=False, return_cov=False,
                 return_mean_grad=False, return_std_grad=False):
         """
@@ -322,7 +451,12 @@ class GaussianProcessRegressor(sk_GaussianProcessRegressor):
                 return y_mean
 
         else:  # Predict based on GP posterior
-            K_trans = self.kernel_(X, self.X_train_)
+            if getattr(self, "_kernel_cross_params", None) is not None:
+                from .gp_specialize import specialized_kernel
+                K_trans = specialized_kernel(X, self.X_train_,
+                                             self._kernel_cross_params)
+            else:
+                K_trans = self.kernel_(X, self.X_train_)
             y_mean = K_trans.dot(self.alpha_)    # Line 4 (y_mean = f_star)
             # undo normalisation
             y_mean = self.y_train_std_ * y_mean + self.y_train_mean_
@@ -335,11 +469,13 @@ class GaussianProcessRegressor(sk_GaussianProcessRegressor):
                 return y_mean, y_cov
 
             elif return_std:
-                K_inv = self.K_inv_
-
-                # Compute variance of predictive distribution
+                # Compute variance of predictive distribution.
+                # K_inv is cached at fit time, so this is one matrix product
+                # (a single BLAS call) plus a row-wise dot product for all
+                # query points.
+                K_trans_K_inv = np.dot(K_trans, self.K_inv_)
                 y_var = self.kernel_.diag(X)
-                y_var -= np.einsum("ki,kj,ij->k", K_trans, K_trans, K_inv)
+                y_var -= np.einsum("ij,ij->i", K_trans_K_inv, K_trans)
 
                 # Check if any of the variances is negative because of
                 # numerical issues. If yes: set the variance to 0.
@@ -361,8 +497,10 @@ class GaussianProcessRegressor(sk_GaussianProcessRegressor):
                 if return_std_grad:
                     grad_std = np.zeros(X.shape[1])
                     if not np.allclose(y_std, grad_std):
-                        grad_std = -np.dot(K_trans,
-                                           np.dot(K_inv, grad))[0] / y_std
+                        # K_trans K_inv is reused from the variance, which
+                        # leaves a vector-matrix product instead of an
+                        # (n_train, n_train) x (n_train, n_features) one
+                        grad_std = -np.dot(K_trans_K_inv, grad)[0] / y_std
                         # undo normalisation
                         grad_std = grad_std * self.y_train_std_**2
                     return y_mean, y_std, grad_mean, grad_std
@@ -23,7 +23,9 @@ def base_minimize(func, dimensions, base_estimator,
                   acq_func="EI", acq_optimizer="lbfgs",
                   x0=None, y0=None, random_state=None, verbose=False,
                   callback=None, n_points=10000, n_restarts_optimizer=5,
-                  xi=0.01, kappa=1.96, n_jobs=1):
+                  xi=0.01, kappa=1.96, n_jobs=1, candidate_sampler="random",
+                  restart_sampler="best", use_numba=False,
+                  prune_candidates=False):
     """
     Parameters
     ----------
@@ -157,6 +159,45 @@ def base_minimize(func, dimensions, base_estimator,
         Defaults to 1 core. If `n_jobs=-1`, then number of jobs is set
         to number of cores.
 
+        The restarts run in threads sharing the fitted model.
+
+    * `candidate_sampler` [string, `"random"` or `"sobol"`, default=`"random"`]:
+        How the `n_points` candidate points are drawn before evaluating
+        `acq_func` on them.
+
+        - If set to `"random"`, the points are sampled at random.
+        - If set to `"sobol"`, the points are taken from a scrambled Sobol'
+          sequence, which covers the space more evenly. A smaller `n_points`
+          then usually suffices.
+
+    * `restart_sampler` [string, `"best"` or `"boltzmann"`, default=`"best"`]:
+        How the `n_restarts_optimizer` starting points are picked among the
+        candidate points when `acq_optimizer` is `"lbfgs"`.
+
+        - If set to `"best"`, the points with the best acquisition values
+          are used.
+        - If set to `"boltzmann"`, the points are drawn at random with
+          probabilities increasing with their acquisition values. The best
+          point is always included. The starting points are more diverse,
+          so fewer restarts are usually needed.
+
+    * `use_numba` [bool, default=False]:
+        Evaluate the acquisition function on the `n_points` candidate
+        points with the compiled functions in
+        `ProcessOptimizer.acquisition_numba`. Requires numba to be
+        installed. The first use compiles the functions, which takes a few
+        seconds.
+
+    * `prune_candidates` [bool, default=False]:
+        Only compute the posterior standard deviation at the candidate
+        points whose bound on the acquisition value shows they can be
+        among the best ones. The bound uses the posterior mean and the
+        variance given the most correlated training point, which are much
+        cheaper.
+        The selected points are the same up to round-off. Only used with a
+        `GaussianProcessRegressor`, `acq_func` EI, PI, LCB or gp_hedge and
+        `restart_sampler="best"`.
+
     Returns
     -------
     * `res` [`OptimizeResult`, scipy object]:
@@ -182,8 +223,10 @@ def base_minimize(func, dimensions, base_estimator,
 
     acq_optimizer_kwargs = {
         "n_points": n_points, "n_restarts_optimizer": n_restarts_optimizer,
-        "n_jobs": n_jobs}
-    acq_func_kwargs = {"xi": xi, "kappa": kappa}
+        "n_jobs": n_jobs, "candidate_sampler": candidate_sampler,
+        "restart_sampler": restart_sampler,
+        "prune_candidates": prune_candidates}
+    acq_func_kwargs = {"xi": xi, "kappa": kappa, "use_numba": use_numba}
 
     # Initialize optimization
     # Suppose there are points provided (x0 and y0), record them
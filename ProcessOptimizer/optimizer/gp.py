@@ -1,10 +1,9 @@
 """Gaussian process-based minimization algorithms."""
 
-import numpy as np
-
 from sklearn.utils import check_random_state
 
 from .base import base_minimize
+from ..space.space import _INT32_MAX
 from ..utils import cook_estimator
 from ..utils import normalize_dimensions
 
@@ -14,7 +13,10 @@ def gp_minimize(func, dimensions, base_estimator=None,
                 acq_func="gp_hedge", acq_optimizer="auto", x0=None, y0=None,
                 random_state=None, verbose=False, callback=None,
                 n_points=10000, n_restarts_optimizer=5, xi=0.01, kappa=1.96,
-                noise="gaussian", n_jobs=1):
+                noise="gaussian", n_jobs=1, candidate_sampler="random",
+                restart_sampler="best", use_numba=False,
+                incremental=False, prune_candidates=False,
+                hyperparam_refit_every=1):
     """Bayesian optimization using Gaussian Processes.
 
     If every function evaluation is expensive, for instance
@@ -189,6 +191,58 @@ def gp_minimize(func, dimensions, base_estimator=None,
         Defaults to 1 core. If `n_jobs=-1`, then number of jobs is set
         to number of cores.
 
+        The restarts run in threads, which share the fitted model instead
+        of copying it to worker processes. Most of the time is spent in
+        NumPy and BLAS, which release the GIL.
+
+    * `candidate_sampler` [string, `"random"` or `"sobol"`, default=`"random"`]:
+        How the `n_points` candidate points are drawn before evaluating
+        `acq_func` on them.
+
+        - If set to `"random"`, the points are sampled at random.
+        - If set to `"sobol"`, the points are taken from a scrambled Sobol'
+          sequence, which covers the space more evenly. A smaller `n_points`
+          (e.g. 1000) then usually gives equally good starting points for
+          `"lbfgs"` at a fraction of the cost.
+
+    * `restart_sampler` [string, `"best"` or `"boltzmann"`, default=`"best"`]:
+        How the `n_restarts_optimizer` starting points are picked among the
+        candidate points when `acq_optimizer` is `"lbfgs"`.
+
+        - If set to `"best"`, the points with the best acquisition values
+          are used.
+        - If set to `"boltzmann"`, the points are drawn at random with
+          probabilities increasing with their acquisition values. The best
+          point is always included. The starting points are more diverse,
+          so fewer restarts are usually needed.
+
+    * `use_numba` [bool, default=False]:
+        Evaluate the acquisition function on the `n_points` candidate
+        points with the compiled functions in
+        `ProcessOptimizer.acquisition_numba`, and let the default Gaussian
+        process evaluate its kernel with compiled code as well. Requires
+        numba to be installed. The first use compiles the functions, which
+        takes a few seconds.
+
+    * `incremental` [bool, default=False]:
+        Let the default Gaussian process extend its Cholesky factor with
+        each new observation instead of refitting, see
+        `GaussianProcessRegressor`. This only takes effect while the kernel
+        hyperparameters are kept fixed. Ignored if `base_estimator` is
+        given.
+
+    * `prune_candidates` [bool, default=False]:
+        Only compute the posterior standard deviation at the candidate
+        points that can be among the best ones, see `base_minimize`.
+
+    * `hyperparam_refit_every` [int, default=1]:
+        Only optimize the kernel hyperparameters of the default Gaussian
+        process on every `hyperparam_refit_every`-th iteration and keep
+        them in between, see `GaussianProcessRegressor`. Together with
+        `incremental=True` the fits in between only extend the previous
+        fit with the new observations. Ignored if `base_estimator` is
+        given.
+
     Returns
     -------
     * `res` [`OptimizeResult`, scipy object]:
@@ -215,10 +269,9 @@ def gp_minimize(func, dimensions, base_estimator=None,
 
     if base_estimator is None:
         base_estimator = cook_estimator(
-            "GP", space=space, random_state=rng.randint(
-              0, np.iinfo(np.int32).max
-              ),
-            noise=noise
+            "GP", space=space, random_state=rng.randint(0, _INT32_MAX),
+            noise=noise, incremental=incremental,
+            use_numba=use_numba, hyperparam_refit_every=hyperparam_refit_every
             )
 
     return base_minimize(
@@ -228,4 +281,7 @@ def gp_minimize(func, dimensions, base_estimator=None,
         n_points=n_points, n_random_starts=n_random_starts,
         n_restarts_optimizer=n_restarts_optimizer,
         x0=x0, y0=y0, random_state=rng, verbose=verbose,
-        callback=callback, n_jobs=n_jobs)
+        callback=callback, n_jobs=n_jobs,
+        candidate_sampler=candidate_sampler,
+        restart_sampler=restart_sampler, use_numba=use_numba,
+        prune_candidates=prune_candidates)
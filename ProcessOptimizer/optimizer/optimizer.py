@@ -1,5 +1,6 @@
 import sys
 import warnings
+from copy import deepcopy
 from math import log
 from numbers import Number
 
@@ -15,11 +16,13 @@ from sklearn.multioutput import MultiOutputRegressor
 from sklearn.utils import check_random_state
 
 from ..acquisition import _gaussian_acquisition
+from ..acquisition import _gaussian_acquisition_from_moments
 from ..acquisition import gaussian_acquisition_1D
 from ..learning import GaussianProcessRegressor
 from ..space import Categorical
 from ..space import Space
 from ..space.constraints import Constraints
+from ..space.space import _INT32_MAX
 from ..utils import check_x_in_space
 from ..utils import cook_estimator
 from ..utils import create_result
@@ -29,6 +32,166 @@ from ..utils import is_2Dlistlike
 from ..utils import normalize_dimensions
 
 
+def _boltzmann_restart_points(X, values, n_restarts, rng, eta=1.0):
+    """Pick starting points for the acquisition optimizer.
+
+    Instead of taking the `n_restarts` best candidates, which tend to lie
+    in the same basin, candidates are drawn without replacement with
+    probabilities proportional to `exp(eta * z)`, where `z` is the
+    standardized acquisition value. For non-negative acquisitions (EI, PI)
+    candidates below `1e-4` times the best value are discarded first. The
+    best candidate is always included as the last starting point.
+
+    Parameters
+    ----------
+    * `X` [array, shape=(n_points, n_dims)]:
+        Candidate points in the transformed space.
+
+    * `values` [array, shape=(n_points,)]:
+        Acquisition values at `X`. Lower is better, as returned by
+        `_gaussian_acquisition`.
+
+    * `n_restarts` [int]:
+        Number of starting points to return.
+
+    * `rng` [RandomState instance]:
+        Random state used for the draw.
+
+    * `eta` [float, default=1.0]:
+        Inverse temperature. Larger values favour the best candidates.
+
+    Returns
+    -------
+    * `x0` [array, shape=(n_restarts, n_dims)]:
+        The selected starting points.
+    """
+    acq = -np.asarray(values, dtype=float)
+    n_restarts = min(n_restarts, len(acq))
+    best = np.argmax(acq)
+    if n_restarts <= 1:
+        return X[[best]]
+
+    candidates = np.arange(len(acq))
+    if acq[best] > 0 and np.all(acq >= 0):
+        threshold = 1e-4
+        while True:
+            keep = np.flatnonzero(acq >= threshold * acq[best])
+            if len(keep) >= n_restarts or threshold < 1e-12:
+                break
+            threshold *= 0.1
+        if len(keep) >= n_restarts:
+            candidates = keep
+    candidates = candidates[candidates != best]
+
+    z = acq[candidates]
+    std = np.std(z)
+    z = (z - np.mean(z)) / std if std > 0 else np.zeros_like(z)
+    weights = np.exp(eta * (z - np.max(z)))
+    probs = weights / np.sum(weights)
+
+    chosen = rng.choice(candidates, size=n_restarts - 1, replace=False,
+                        p=probs)
+    return X[np.append(chosen, best)]
+
+
+def _pruned_acquisition(X, model, y_opt, acq_funcs, acq_func_kwargs, n_best,
+                        n_check=16):
+    """Evaluate acquisition functions where they can be among the best.
+
+    The posterior mean is predicted at all of `X`, but the posterior
+    standard deviation, whose variance term dominates the cost of `predict`,
+    only where it is needed. Conditioning on fewer points can only increase
+    the variance, so the variance given the single most correlated training
+    point bounds the posterior one from above. EI, PI and LCB are all at
+    least as good with a larger standard deviation (PI is bounded by 1
+    where the mean already improves on `y_opt`), which gives an optimistic
+    value for every point. The standard deviation is first computed at the
+    `n_check` points with the best optimistic values, and then at every
+    point whose optimistic value is better than the `n_best`-th best exact
+    value. Up to round-off, the `n_best` best points are the same as
+    without pruning.
+
+    Parameters
+    ----------
+    * `X` [array, shape=(n_points, n_dims)]:
+        Candidate points in the transformed space.
+
+    * `model` [GaussianProcessRegressor]:
+        The fitted model. Its fitted attributes are used directly to avoid
+        evaluating the kernel twice.
+
+    * `y_opt` [float]:
+        The best observed value.
+
+    * `acq_funcs` [list of strings]:
+        Acquisition functions to evaluate, any of `"EI"`, `"PI"`, `"LCB"`.
+
+    * `acq_func_kwargs` [dict]:
+        Additional arguments to the acquisition functions.
+
+    * `n_best` [int]:
+        Number of best points that must have their exact values.
+
+    * `n_check` [int, default=16]:
+        Number of points evaluated exactly to get the first threshold.
+
+    Returns
+    -------
+    * `values` [list of arrays, shape=(n_points,)]:
+        Acquisition values at `X` for each of `acq_funcs`, lower is better,
+        as returned by `_gaussian_acquisition`. They are exact for the
+        `n_best` best points, and optimistic bounds for the pruned ones.
+    """
+    if acq_func_kwargs is None:
+        acq_func_kwargs = dict()
+    xi = acq_func_kwargs.get("xi", 0.01)
+    n_best = max(1, min(n_best, len(X)))
+    n_check = max(n_best, min(n_check, len(X)))
+
+    # The variance given all training points is at most the variance given
+    # any single one of them, k(x, x) - k(x, x_j)^2 / K_jj, where K_jj is
+    # the diagonal of the kernel matrix of the training points with noise
+    K_trans = model.kernel_(X, model.X_train_)
+    mu = K_trans.dot(model.alpha_) * model.y_train_std_ + model.y_train_mean_
+    prior_var = model.kernel_.diag(X)
+    K_diag = np.einsum("ij,ij->i", model.L_, model.L_)
+    var = prior_var - np.max(np.square(K_trans) / K_diag, axis=1)
+    std = np.sqrt(np.maximum(var, 0)) * model.y_train_std_
+    exact = np.zeros(len(X), dtype=bool)
+
+    def acquisition(acq_func):
+        values = _gaussian_acquisition_from_moments(
+            mu, std, y_opt=y_opt, acq_func=acq_func,
+            acq_func_kwargs=acq_func_kwargs
+        )
+        if acq_func == "PI":
+            values[~exact & (mu <= y_opt - xi)] = -1.0
+        return values
+
+    while True:
+        needed = np.zeros(len(X), dtype=bool)
+        for acq_func in acq_funcs:
+            values = acquisition(acq_func)
+            if np.count_nonzero(exact) >= n_best:
+                threshold = np.partition(values[exact], n_best - 1)[n_best - 1]
+                needed |= ~exact & (values < threshold)
+            else:
+                needed[np.argpartition(values, n_check - 1)[:n_check]] = True
+        needed &= ~exact
+        if not np.any(needed):
+            break
+        # Same as model.predict(X[needed], return_std=True), without
+        # evaluating the kernel again
+        K_needed = K_trans[needed]
+        var = prior_var[needed] - np.einsum(
+            "ij,ij->i", K_needed.dot(model.K_inv_), K_needed
+        )
+        std[needed] = np.sqrt(np.maximum(var, 0)) * model.y_train_std_
+        exact |= needed
+
+    return [acquisition(acq_func) for acq_func in acq_funcs]
+
+
 class Optimizer(object):
     """Run bayesian optimisation loop.
 
@@ -74,6 +237,8 @@ class Optimizer(object):
         If set to True, the optimizer will use latin hypercube sampling for the 
         first n_initial_points. If set to False, the optimizer will return 
         random points
+        The order of the samples in each dimension is drawn from
+        `random_state`.
 
     * `acq_func` [string, default=`"gp_hedge"`]:
         Function to minimize over the posterior distribution. Can be either
@@ -130,6 +295,22 @@ class Optimizer(object):
         -  "length_scale" [list] a list of floats
         - "n_restarts_optimizer" [int]
         - "n_jobs" [int]
+        - "candidate_sampler" [string, `"random"` or `"sobol"`] how the
+          `n_points` candidate points are drawn before the acquisition
+          function is evaluated on them. `"sobol"` uses a scrambled Sobol'
+          sequence, which covers the space more evenly than `"random"`.
+        - "restart_sampler" [string, `"best"` or `"boltzmann"`] how the
+          `n_restarts_optimizer` starting points for `"lbfgs"` are picked
+          among the candidate points. `"best"` takes those with the best
+          acquisition values, `"boltzmann"` draws them at random weighted by
+          their acquisition values, which gives more diverse starting points.
+        - "prune_candidates" [bool] only predict the posterior standard
+          deviation at the candidate points that can be among the best.
+          The bound is the variance given the single most correlated
+          training point, k(x, x) - k(x, x_j)^2 / K_jj, which is never
+          smaller than the posterior variance. The selected points are
+          unchanged. Only used with a `GaussianProcessRegressor`,
+          the EI, PI or LCB acquisition functions and `"best"` restarts.
         
     * `n_objectives` [int, default=1]:
         Number of objectives to be optimized. 
@@ -229,6 +410,25 @@ class Optimizer(object):
         )
         n_jobs = acq_optimizer_kwargs.get("n_jobs", 1)
         self.n_jobs = n_jobs
+        self.candidate_sampler = acq_optimizer_kwargs.get(
+            "candidate_sampler", "random"
+        )
+        if self.candidate_sampler not in ["random", "sobol"]:
+            raise ValueError(
+                "Expected candidate_sampler to be 'random' or "
+                "'sobol', got {0}".format(self.candidate_sampler)
+            )
+        self.restart_sampler = acq_optimizer_kwargs.get(
+            "restart_sampler", "best"
+        )
+        if self.restart_sampler not in ["best", "boltzmann"]:
+            raise ValueError(
+                "Expected restart_sampler to be 'best' or "
+                "'boltzmann', got {0}".format(self.restart_sampler)
+            )
+        self.prune_candidates = acq_optimizer_kwargs.get(
+            "prune_candidates", False
+        )
         self.acq_optimizer_kwargs = acq_optimizer_kwargs
 
         # Configure estimator
@@ -238,7 +438,7 @@ class Optimizer(object):
             base_estimator = cook_estimator(
                 base_estimator,
                 space=dimensions,
-                random_state=self.rng.randint(0, np.iinfo(np.int32).max),
+                random_state=self.rng.randint(0, _INT32_MAX),
                 length_scale_bounds=self._length_scale_bounds,
                 length_scale=self._length_scale,
             )
@@ -299,7 +499,8 @@ class Optimizer(object):
 
         self._lhs = lhs
         if lhs:
-            self._lhs_samples = self.space.lhs(n_initial_points)
+            self._lhs_samples = self.space.lhs(n_initial_points,
+                                               random_state=self.rng)
 
         # Default is no constraints
         self._constraints = None
@@ -317,6 +518,9 @@ class Optimizer(object):
         self.models = []
         self.Xi = []
         self.yi = []
+        # Transformed copy of `Xi`, see `_transformed_Xi`
+        self._Xt = np.empty((0, self.space.transformed_n_dims))
+        self._n_Xt = 0
 
         # Initialize cache for `ask` method responses
 
@@ -337,7 +541,9 @@ class Optimizer(object):
             dimensions=self.space.dimensions,
             base_estimator=self.base_estimator_,
             n_initial_points=self.n_initial_points_,
-            lhs=self._lhs,
+            # The samples are copied below, drawing them again would use
+            # up random numbers from `random_state`
+            lhs=False,
             acq_func=self.acq_func,
             acq_optimizer=self.acq_optimizer,
             acq_func_kwargs=self.acq_func_kwargs,
@@ -348,6 +554,7 @@ class Optimizer(object):
 
         # It is important to copy the constraints so that a call to '_tell()' will create a valid _next_x
         optimizer._constraints = self._constraints
+        optimizer._lhs = self._lhs
         if self._lhs:
             optimizer._lhs_samples = self._lhs_samples
 
@@ -457,7 +664,7 @@ class Optimizer(object):
         # deletion of points with "lie" objective (the copy of
         # optimizer is simply discarded)
         opt = self.copy(
-            random_state=self.rng.randint(0, np.iinfo(np.int32).max)
+            random_state=self.rng.randint(0, _INT32_MAX)
         )
 
         X = []
@@ -692,7 +899,7 @@ class Optimizer(object):
                     y_list = [item[i] for item in self.yi]
                     with warnings.catch_warnings():
                         warnings.simplefilter("ignore")
-                        est.fit(self.space.transform(self.Xi), y_list)
+                        est.fit(self._transformed_Xi(), y_list)
                     obj_models.append(est)
 
                 # Append all objective functions
@@ -724,12 +931,20 @@ class Optimizer(object):
                     )[0]
 
             if self.n_objectives == 1:
+                if self.models and (
+                    getattr(est, "incremental", False)
+                    or getattr(est, "hyperparam_refit_every", 1) > 1
+                ):
+                    # Continue from the previous model, so that it can keep
+                    # its hyperparameters or extend its fit with the new
+                    # points instead of refitting from scratch
+                    est = deepcopy(self.models[-1])
                 with warnings.catch_warnings():
                     warnings.simplefilter("ignore")
-                    est.fit(self.space.transform(self.Xi), self.yi)
+                    est.fit(self._transformed_Xi(), self.yi)
 
                 if hasattr(self, "next_xs_") and self.acq_func == "gp_hedge":
-                    self.gains_ -= est.predict(np.vstack(self.next_xs_))
+                    self.gains_ -= est.predict(self.next_xs_)
                 self.models.append(est)
 
                 # even with BFGS as optimizer we want to sample a large number
@@ -742,21 +957,70 @@ class Optimizer(object):
                         )
                     )
                 else:
-                    X = self.space.transform(
-                        self.space.rvs(
-                            n_samples=self.n_points, random_state=self.rng
-                        )
+                    # All candidates are evaluated as one batch below, so
+                    # draw them directly as a float64 array in the
+                    # transformed space
+                    X = self.space.rvs_transformed(
+                        n_samples=self.n_points,
+                        random_state=self.rng,
+                        sampler=self.candidate_sampler,
                     )
 
-                self.next_xs_ = []
-                for cand_acq_func in self.cand_acq_funcs_:
-                    values = _gaussian_acquisition(
-                        X=X,
-                        model=est,
-                        y_opt=np.min(self.yi),
-                        acq_func=cand_acq_func,
-                        acq_func_kwargs=self.acq_func_kwargs,
+                # self.yi is a list, convert it only once per iteration
+                y_opt = np.min(self.yi)
+
+                # All candidate acquisition functions (three for gp_hedge)
+                # are evaluated on the same points, so unless a time model
+                # is needed the posterior is predicted only once
+                if "ps" in self.acq_func:
+                    acq_values = [
+                        _gaussian_acquisition(
+                            X=X,
+                            model=est,
+                            y_opt=y_opt,
+                            acq_func=cand_acq_func,
+                            acq_func_kwargs=self.acq_func_kwargs,
+                        )
+                        for cand_acq_func in self.cand_acq_funcs_
+                    ]
+                elif (
+                    self.prune_candidates
+                    and isinstance(est, GaussianProcessRegressor)
+                    and self.restart_sampler == "best"
+                ):
+                    if self.acq_optimizer == "sampling" or self._constraints:
+                        n_best = 1
+                    else:
+                        n_best = self.n_restarts_optimizer
+                    acq_values = _pruned_acquisition(
+                        X,
+                        est,
+                        y_opt,
+                        self.cand_acq_funcs_,
+                        self.acq_func_kwargs,
+                        n_best,
                     )
+                else:
+                    with warnings.catch_warnings():
+                        warnings.simplefilter("ignore")
+                        mu, std = est.predict(X, return_std=True)
+                    acq_values = [
+                        _gaussian_acquisition_from_moments(
+                            mu,
+                            std,
+                            y_opt=y_opt,
+                            acq_func=cand_acq_func,
+                            acq_func_kwargs=self.acq_func_kwargs,
+                        )
+                        for cand_acq_func in self.cand_acq_funcs_
+                    ]
+
+                self.next_xs_ = np.empty(
+                    (len(self.cand_acq_funcs_), self.space.transformed_n_dims)
+                )
+                for i, (cand_acq_func, values) in enumerate(
+                    zip(self.cand_acq_funcs_, acq_values)
+                ):
                     # Find the minimum of the acquisition function by randomly
                     # sampling points from the space. If constraints are present
                     # we use this strategy
@@ -767,17 +1031,26 @@ class Optimizer(object):
                     # minimization starts from `n_restarts_optimizer` different
                     # points and the best minimum is used
                     elif self.acq_optimizer == "lbfgs":
-                        x0 = X[np.argsort(values)[: self.n_restarts_optimizer]]
+                        if self.restart_sampler == "boltzmann":
+                            x0 = _boltzmann_restart_points(
+                                X, values, self.n_restarts_optimizer, self.rng
+                            )
+                        else:
+                            x0 = X[
+                                np.argsort(values)[: self.n_restarts_optimizer]
+                            ]
 
                         with warnings.catch_warnings():
                             warnings.simplefilter("ignore")
-                            results = Parallel(n_jobs=self.n_jobs)(
+                            results = Parallel(
+                                n_jobs=self.n_jobs, prefer="threads"
+                            )(
                                 delayed(fmin_l_bfgs_b)(
                                     gaussian_acquisition_1D,
                                     x,
                                     args=(
                                         est,
-                                        np.min(self.yi),
+                                        y_opt,
                                         cand_acq_func,
                                         self.acq_func_kwargs,
                                     ),
@@ -800,16 +1073,14 @@ class Optimizer(object):
                             transformed_bounds[:, 0],
                             transformed_bounds[:, 1],
                         )
-                    self.next_xs_.append(next_x)
+                    self.next_xs_[i] = next_x
 
                 if self.acq_func == "gp_hedge":
-                    logits = np.array(self.gains_)
-                    logits -= np.max(logits)
-                    exp_logits = np.exp(self.eta * logits)
-                    probs = exp_logits / np.sum(exp_logits)
-                    next_x = self.next_xs_[
-                        np.argmax(self.rng.multinomial(1, probs))
-                    ]
+                    probs = np.exp(
+                        self.eta * (self.gains_ - np.max(self.gains_))
+                    )
+                    probs /= np.sum(probs)
+                    next_x = self.next_xs_[self.rng.choice(len(probs), p=probs)]
                 else:
                     next_x = self.next_xs_[0]
 
@@ -823,6 +1094,36 @@ class Optimizer(object):
             self.Xi, self.yi, self.space, self.rng, models=self.models
         )
 
+    def _transformed_Xi(self):
+        """Return the points in `Xi` transformed to the model space.
+
+        The transformed points are kept as the first rows of a C-contiguous
+        float64 buffer which grows geometrically, so each call only
+        transforms the points that were added since the previous call,
+        instead of the whole history. `Xi` is append-only, if it has
+        shrunk the buffer is rebuilt.
+
+        Returns
+        -------
+        * `Xt` [array, shape=(len(Xi), transformed_n_dims)]:
+            A view of the buffer. It is overwritten when points are added.
+        """
+        n = len(self.Xi)
+        if n < self._n_Xt:
+            self._n_Xt = 0
+        if n > len(self._Xt):
+            Xt = np.empty(
+                (max(n, 2 * len(self._Xt)), self.space.transformed_n_dims)
+            )
+            Xt[: self._n_Xt] = self._Xt[: self._n_Xt]
+            self._Xt = Xt
+        if n > self._n_Xt:
+            self._Xt[self._n_Xt : n] = self.space.transform(
+                self.Xi[self._n_Xt : n]
+            )
+            self._n_Xt = n
+        return self._Xt[:n]
+
     def _check_y_is_valid(self, x, y):
         """Check if the shape and types of x and y are consistent."""
 
@@ -1052,7 +1353,7 @@ class Optimizer(object):
         # Initialize Steinerberger sum
         stbr_sum = 0
         # Transform initial points to [0,1]^d space
-        Xi = self.space.transform(self.Xi)
+        Xi = self._transformed_Xi()
         # for loop over all existing points
         for i in range(len(Xi)):
             # Calculate the factors in the Steinerberger term in each dimension
@@ -1094,7 +1395,7 @@ class Optimizer(object):
         IndexF, FatorF = self.__LargestOfLeast(front, self.yi)
 
         IndexPop, FatorPop = self.__LargestOfLeast(
-            Population, self.space.transform(self.Xi).tolist()
+            Population, self._transformed_Xi().tolist()
         )
 
         Fator = q * FatorF + (1 - q) * FatorPop
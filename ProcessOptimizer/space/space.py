@@ -1,7 +1,9 @@
 import numbers
+import warnings
 import numpy as np
 import yaml
 
+from scipy.stats import qmc
 from scipy.stats.distributions import randint
 from scipy.stats.distributions import rv_discrete
 from scipy.stats.distributions import uniform
@@ -15,6 +17,9 @@ from .transformers import Identity
 from .transformers import Log10
 from .transformers import Pipeline
 
+# Upper bound for the seeds drawn from a random state
+_INT32_MAX = np.iinfo(np.int32).max
+
 # helper class to be able to print [1, ..., 4] instead of [1, '...', 4]
 
 
@@ -685,12 +690,43 @@ class Space(object):
            Points sampled from the space.
         """
 
-        rng = check_random_state(random_state)
+        columns = self._rvs_columns(n_samples, random_state)
 
-        columns = []
+        # Transpose
+        rows = []
+        for i in range(n_samples):
+            r = []
+            for j in range(self.n_dims):
+                r.append(columns[j][i])
 
-        for dim in self.dimensions:
-            columns.append(dim.rvs(n_samples=n_samples, random_state=rng))
+            rows.append(r)
+
+        return rows
+
+    def sobol(self, n_samples=1, random_state=None):
+        """Draw quasi-random samples from a scrambled Sobol' sequence.
+
+        The samples cover the space more evenly than those drawn by `rvs`,
+        which makes them useful as candidate points when minimizing an
+        acquisition function. Each dimension is sampled through the inverse
+        of the same distribution that `rvs` draws from, so priors are
+        respected.
+
+        Parameters
+        ----------
+        * `n_samples` [int, default=1]:
+            Number of samples to be drawn from the space.
+
+        * `random_state` [int, RandomState instance, or None (default)]:
+            Set random state to something other than None for reproducible
+            results.
+
+        Returns
+        -------
+        * `points`: [list of lists, shape=(n_points, n_dims)]
+           Points sampled from the space.
+        """
+        columns = self._sobol_columns(n_samples, random_state)
 
         # Transpose
         rows = []
@@ -703,6 +739,75 @@ class Space(object):
 
         return rows
 
+    def _rvs_columns(self, n_samples, random_state):
+        """Draw random samples, one list or array per dimension."""
+        rng = check_random_state(random_state)
+
+        columns = []
+
+        for dim in self.dimensions:
+            columns.append(dim.rvs(n_samples=n_samples, random_state=rng))
+
+        return columns
+
+    def _sobol_columns(self, n_samples, random_state):
+        """Draw Sobol' samples, one list or array per dimension."""
+        rng = check_random_state(random_state)
+        sampler = qmc.Sobol(d=self.n_dims, scramble=True,
+                            seed=rng.randint(0, _INT32_MAX))
+        with warnings.catch_warnings():
+            # Sobol' warns when n_samples is not a power of two
+            warnings.simplefilter("ignore")
+            unit_samples = sampler.random(n_samples)
+
+        columns = []
+        for j, dim in enumerate(self.dimensions):
+            samples = dim._rvs.ppf(unit_samples[:, j])
+            if isinstance(dim, Categorical):
+                columns.append([dim.categories[int(c)] for c in samples])
+            else:
+                columns.append(dim.inverse_transform(samples))
+
+        return columns
+
+    def rvs_transformed(self, n_samples=1, random_state=None,
+                        sampler="random"):
+        """Draw samples directly in the warped space.
+
+        This gives the same points as `transform(rvs(...))` or
+        `transform(sobol(...))`, but each dimension is transformed as a
+        whole instead of going through a list of points. This is much faster
+        when drawing many samples, e.g. candidate points for an acquisition
+        function.
+
+        Parameters
+        ----------
+        * `n_samples` [int, default=1]:
+            Number of samples to be drawn from the space.
+
+        * `random_state` [int, RandomState instance, or None (default)]:
+            Set random state to something other than None for reproducible
+            results.
+
+        * `sampler` [string, `"random"` or `"sobol"`, default=`"random"`]:
+            Whether to draw the samples as `rvs` or as `sobol` does.
+
+        Returns
+        -------
+        * `Xt` [array of floats, shape=(n_samples, transformed_n_dims)]
+            The transformed samples, as a C-contiguous float64 array.
+        """
+        if sampler == "sobol":
+            columns = self._sobol_columns(n_samples, random_state)
+        else:
+            columns = self._rvs_columns(n_samples, random_state)
+
+        Xt = np.hstack([
+            np.asarray(dim.transform(column)).reshape((n_samples, -1))
+            for dim, column in zip(self.dimensions, columns)
+        ])
+        return np.ascontiguousarray(Xt, dtype=np.float64)
+
     def transform(self, X):
         """Transform samples from the original space into a warped space.
 
@@ -853,16 +958,31 @@ class Space(object):
 
         return distance
 
-    def lhs(self, n):
+    def lhs(self, n, random_state=None):
         """ Returns n latin hypercube samples as a list of lists
+
+        Parameters
+        ----------
+        * `n` [int]:
+            Number of samples.
+
+        * `random_state` [int, RandomState instance, or None (default)]:
+            Set random state to something other than None for reproducible
+            results. If None, the samples of each dimension are permuted
+            with the fixed seeds `42 + i`, so the design is always the same.
         """
+        if random_state is not None:
+            rng = check_random_state(random_state)
 
         samples = []
         for i in range(self.n_dims):
             lhs_perm = []
             # Get evenly distributed samples from one dimension
             lhs_aranged = self.dimensions[i].lhs_arange(n)
-            perm = np.random.RandomState(seed=42 + i).permutation(n)
+            if random_state is None:
+                perm = np.random.RandomState(seed=42 + i).permutation(n)
+            else:
+                perm = rng.permutation(n)
             for p in perm:  # Random permutate the order of the samples
                 lhs_perm.append(lhs_aranged[p])
             samples.append(lhs_perm)
@@ -1,8 +1,12 @@
 
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
 import numpy as np
 import pytest
 
 from scipy import optimize
+from scipy.stats import norm
 
 from sklearn.multioutput import MultiOutputRegressor
 from numpy.testing import assert_array_almost_equal
@@ -10,6 +14,8 @@ from numpy.testing import assert_array_equal
 from numpy.testing import assert_raises
 
 from ProcessOptimizer.acquisition import _gaussian_acquisition
+from ProcessOptimizer.acquisition import _gaussian_acquisition_from_moments
+from ProcessOptimizer.acquisition import _norm_pdf
 from ProcessOptimizer.acquisition import gaussian_acquisition_1D
 from ProcessOptimizer.acquisition import gaussian_ei
 from ProcessOptimizer.acquisition import gaussian_lcb
@@ -97,6 +103,84 @@ def test_acquisition_api():
         assert_raises(ValueError, method, rng.rand(10), gpr)
 
 
+@pytest.mark.fast_test
+@pytest.mark.parametrize("acq_func", ["LCB", "EI", "PI"])
+def test_acquisition_numba(acq_func):
+    pytest.importorskip("numba")
+    rng = np.random.RandomState(0)
+    X = rng.randn(10, 2)
+    y = rng.randn(10)
+    gpr = GaussianProcessRegressor(kernel=Matern() + WhiteKernel())
+    gpr.fit(X, y)
+    X_new = rng.randn(100, 2)
+
+    values = _gaussian_acquisition(X_new, gpr, np.min(y), acq_func=acq_func)
+    values_numba = _gaussian_acquisition(
+        X_new, gpr, np.min(y), acq_func=acq_func,
+        acq_func_kwargs={"use_numba": True})
+    assert_array_almost_equal(values, values_numba)
+
+
+@pytest.mark.fast_test
+@pytest.mark.parametrize("acq_func", ["LCB", "EI", "PI"])
+def test_acquisition_numba_threads(monkeypatch, acq_func):
+    pytest.importorskip("numba")
+    from ProcessOptimizer import acquisition_numba
+
+    # Entering the parallel loop from several threads at once, as in the
+    # restarts of the lbfgs acquisition optimizer, aborts the process with
+    # numba's default threading layer. Record who enters it.
+    callers = []
+    for name in ["_ei_parallel", "_pi_parallel", "_lcb_parallel"]:
+        def recording(*args, parallel=getattr(acquisition_numba, name)):
+            callers.append(threading.current_thread())
+            return parallel(*args)
+        monkeypatch.setattr(acquisition_numba, name, recording)
+
+    rng = np.random.RandomState(0)
+    mu = rng.randn(200)
+    std = np.abs(rng.randn(200))
+    std[:10] = 0.0
+    kwargs = {"use_numba": True}
+    values = _gaussian_acquisition_from_moments(
+        mu, std, 0.0, acq_func, kwargs)
+    assert callers == [threading.main_thread()]
+    assert_array_almost_equal(values[:1], _gaussian_acquisition_from_moments(
+        mu[:1], std[:1], 0.0, acq_func, kwargs))
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        values_threads = list(executor.map(
+            lambda args: _gaussian_acquisition_from_moments(*args),
+            [(mu, std, 0.0, acq_func, kwargs)] * 8))
+    for values_thread in values_threads:
+        assert_array_almost_equal(values, values_thread)
+    # neither the single point nor the other threads used the parallel loop
+    assert callers == [threading.main_thread()]
+
+
+@pytest.mark.fast_test
+def test_norm_pdf():
+    z = np.linspace(-40, 40, 1001)
+    assert_array_almost_equal(_norm_pdf(z), norm.pdf(z))
+
+
+@pytest.mark.fast_test
+@pytest.mark.parametrize("acq_func", ["LCB", "EI", "PI"])
+def test_acquisition_from_moments(acq_func):
+    rng = np.random.RandomState(0)
+    X = rng.randn(10, 2)
+    y = rng.randn(10)
+    gpr = GaussianProcessRegressor(kernel=Matern() + WhiteKernel())
+    gpr.fit(X, y)
+    X_new = rng.randn(100, 2)
+
+    values = _gaussian_acquisition(X_new, gpr, np.min(y), acq_func=acq_func)
+    mu, std = gpr.predict(X_new, return_std=True)
+    values_moments = _gaussian_acquisition_from_moments(
+        mu, std, np.min(y), acq_func=acq_func)
+    assert_array_equal(values, values_moments)
+
+
 def check_gradient_correctness(X_new, model, acq_func, y_opt):
     analytic_grad = gaussian_acquisition_1D(
         X_new, model, y_opt, acq_func)[1]
@@ -1,4 +1,8 @@
+import importlib
+import tempfile
+
 import numpy as np
+from numpy.testing import assert_array_almost_equal
 from numpy.testing import assert_array_equal
 import pytest
 
@@ -8,7 +12,10 @@ from ProcessOptimizer.benchmarks import bench2
 from ProcessOptimizer.benchmarks import bench3
 from ProcessOptimizer.benchmarks import bench4
 from ProcessOptimizer.benchmarks import branin
+from ProcessOptimizer.space import Space
 from ProcessOptimizer.utils import cook_estimator
+from ProcessOptimizer.utils import dump
+from ProcessOptimizer.utils import load
 
 
 def check_minimize(func, y_opt, bounds, acq_optimizer, acq_func,
@@ -92,3 +99,133 @@ def test_use_given_estimator():
                       base_estimator=estimator, noise=noise_fake)
 
     assert res['models'][-1].noise == noise_correct
+
+
+@pytest.mark.fast_test
+@pytest.mark.parametrize("acq_optimizer", ["sampling", "lbfgs"])
+def test_sobol_candidate_sampler(monkeypatch, acq_optimizer):
+    rvs_transformed = Space.rvs_transformed
+    samplers = []
+
+    def recording_rvs_transformed(self, *args, **kwargs):
+        samplers.append(kwargs.get("sampler", "random"))
+        return rvs_transformed(self, *args, **kwargs)
+
+    monkeypatch.setattr(Space, "rvs_transformed", recording_rvs_transformed)
+
+    results = {}
+    for candidate_sampler in ["random", "sobol", "sobol"]:
+        samplers.clear()
+        res = gp_minimize(branin, ((-5.0, 10.0), (0.0, 15.0)),
+                          acq_optimizer=acq_optimizer, n_random_starts=3,
+                          n_calls=5, n_points=256, random_state=1,
+                          candidate_sampler=candidate_sampler)
+        # the candidate points of every model are drawn with the sampler
+        assert samplers == [candidate_sampler] * len(res.models)
+        if candidate_sampler in results:
+            assert_array_equal(res.x_iters, results[candidate_sampler])
+        results[candidate_sampler] = res.x_iters
+
+    # the initial points are the same, the suggested ones are not
+    assert_array_equal(results["random"][:3], results["sobol"][:3])
+    assert not np.allclose(results["random"][3:], results["sobol"][3:])
+
+
+@pytest.mark.fast_test
+def test_boltzmann_restart_sampler(monkeypatch):
+    optimizer_module = importlib.import_module(
+        "ProcessOptimizer.optimizer.optimizer")
+    restart_points = optimizer_module._boltzmann_restart_points
+    calls = []
+
+    def recording_restart_points(X, values, n_restarts, rng, **kwargs):
+        x0 = restart_points(X, values, n_restarts, rng, **kwargs)
+        calls.append((X[np.argmin(values)], x0))
+        return x0
+
+    monkeypatch.setattr(optimizer_module, "_boltzmann_restart_points",
+                        recording_restart_points)
+
+    results = {}
+    for restart_sampler in ["best", "boltzmann"]:
+        results[restart_sampler] = gp_minimize(
+            bench3, [(-2.0, 2.0)], acq_optimizer="lbfgs", acq_func="EI",
+            n_calls=6, n_random_starts=3, n_restarts_optimizer=3,
+            random_state=1, noise=1e-10, restart_sampler=restart_sampler)
+        if restart_sampler == "best":
+            assert not calls
+
+    # one draw of starting points per model, each with the best candidate
+    assert len(calls) == len(results["boltzmann"].models)
+    for best, x0 in calls:
+        assert len(x0) == 3
+        assert any(np.array_equal(best, x) for x in x0)
+    # the starting points differ, and so do the suggested points
+    assert not np.allclose(results["best"].x_iters,
+                           results["boltzmann"].x_iters)
+
+
+@pytest.mark.fast_test
+def test_use_numba():
+    pytest.importorskip("numba")
+    r_numpy = gp_minimize(bench3, [(-2.0, 2.0)], acq_optimizer="sampling",
+                          acq_func="EI", n_calls=5, n_random_starts=3,
+                          random_state=1, noise=1e-10)
+    r_numba = gp_minimize(bench3, [(-2.0, 2.0)], acq_optimizer="sampling",
+                          acq_func="EI", n_calls=5, n_random_starts=3,
+                          random_state=1, noise=1e-10, use_numba=True)
+    assert_array_equal(r_numpy.x_iters, r_numba.x_iters)
+
+
+@pytest.mark.fast_test
+def test_use_numba_lbfgs_threads():
+    pytest.importorskip("numba")
+    # the lbfgs restarts predict from several threads at once
+    res = gp_minimize(bench3, [(-2.0, 2.0)], acq_optimizer="lbfgs",
+                      n_calls=5, n_random_starts=3, n_jobs=2,
+                      random_state=1, use_numba=True)
+    # the fitted models can still be stored
+    with tempfile.TemporaryFile() as f:
+        dump(res, f)
+        f.seek(0)
+        res_loaded = load(f)
+    assert_array_equal(res.models[-1].predict([[0.5]]),
+                       res_loaded.models[-1].predict([[0.5]]))
+
+
+@pytest.mark.fast_test
+def test_incremental():
+    space = [(-2.0, 2.0)]
+    results = []
+    for incremental in [False, True]:
+        base_estimator = cook_estimator("GP", space=space, random_state=1,
+                                        noise=1e-10, optimizer=None,
+                                        incremental=incremental)
+        results.append(gp_minimize(bench3, space,
+                                   base_estimator=base_estimator,
+                                   acq_optimizer="sampling", acq_func="EI",
+                                   n_calls=8, n_random_starts=3,
+                                   random_state=1))
+    assert_array_equal(results[0].x_iters, results[1].x_iters)
+
+
+@pytest.mark.fast_test
+def test_hyperparam_refit_every():
+    res = gp_minimize(bench3, [(-2.0, 2.0)], acq_optimizer="sampling",
+                      n_calls=8, n_random_starts=3, random_state=1,
+                      incremental=True, hyperparam_refit_every=2)
+    thetas = [model.kernel_.theta for model in res.models]
+    assert_array_almost_equal(thetas[0], thetas[1])
+    assert_array_almost_equal(thetas[2], thetas[3])
+    assert np.any(thetas[1] != thetas[2])
+
+
+@pytest.mark.fast_test
+@pytest.mark.parametrize("acq_optimizer", ["sampling", "lbfgs"])
+def test_prune_candidates(acq_optimizer):
+    results = [gp_minimize(branin, ((-5.0, 10.0), (0.0, 15.0)),
+                           acq_optimizer=acq_optimizer, n_random_starts=3,
+                           n_calls=6, n_points=500, random_state=1,
+                           prune_candidates=prune_candidates)
+               for prune_candidates in [False, True]]
+    np.testing.assert_allclose(results[0].x_iters, results[1].x_iters)
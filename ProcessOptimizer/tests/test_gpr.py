@@ -1,19 +1,28 @@
+import pickle
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
 import numpy as np
 import pytest
 
 from scipy import optimize
+from scipy.linalg import solve_triangular
+from scipy.stats import norm
 
+from numpy.testing import assert_allclose
 from numpy.testing import assert_almost_equal
 from numpy.testing import assert_array_almost_equal
 from numpy.testing import assert_array_equal
 
 from ProcessOptimizer.learning import GaussianProcessRegressor
+from ProcessOptimizer.learning.gaussian_process.kernels import ConstantKernel
 from ProcessOptimizer.learning.gaussian_process.kernels import RBF
 from ProcessOptimizer.learning.gaussian_process.kernels import Matern
 from ProcessOptimizer.learning.gaussian_process.kernels import WhiteKernel
 from ProcessOptimizer.learning.gaussian_process.gpr import (
     _param_for_white_kernel_in_Sum
 )
+from ProcessOptimizer.utils import cook_estimator
 
 rng = np.random.RandomState(0)
 X = rng.randn(5, 5)
@@ -100,6 +109,37 @@ def test_std_gradient():
     assert_array_almost_equal(std_grad, num_grad, decimal=3)
 
 
+@pytest.mark.fast_test
+def test_std_gradient_bo_fit():
+    # Close to the observations of a fit as in Bayesian optimization the
+    # standard deviation is small and sensitive to rounding errors
+    rs = np.random.RandomState(0)
+    X_train = rs.rand(30, 2)
+    y_train = np.sin(3 * X_train[:, 0]) + np.cos(2 * X_train[:, 1])
+    gpr = cook_estimator("GP", space=[(0., 1.)] * 2, noise="gaussian",
+                         random_state=1).fit(X_train, y_train)
+
+    for x in [X_train[0] + 0.01, X_train[5] + [0.02, -0.01], [0.5, 0.5]]:
+        x = np.asarray(x)
+        _, std, _, std_grad = gpr.predict(
+            x[np.newaxis], return_std=True, return_mean_grad=True,
+            return_std_grad=True)
+
+        # reference from triangular solves with the Cholesky factor
+        K_trans = gpr.kernel_(x[np.newaxis], gpr.X_train_)[0]
+        K_trans_grad = gpr.kernel_.gradient_x(x, gpr.X_train_)
+        v = solve_triangular(gpr.L_, K_trans, lower=True)
+        v_grad = solve_triangular(gpr.L_, K_trans_grad, lower=True)
+        std_grad_ref = -v.dot(v_grad) / std * gpr.y_train_std_**2
+        assert_allclose(std_grad, std_grad_ref, rtol=1e-6)
+
+        eps = 1e-4
+        num_grad = [(gpr.predict([x + eps * e], return_std=True)[1][0]
+                     - gpr.predict([x - eps * e], return_std=True)[1][0])
+                    / (2 * eps) for e in np.eye(2)]
+        assert_allclose(std_grad, num_grad, rtol=1e-2)
+
+
 def test_gpr_handles_similar_points():
     """
     This tests whether our implementation of GPR
@@ -136,3 +176,151 @@ def test_ytrain_mean_std():
     gpr = GaussianProcessRegressor(random_state=0, normalize_y= False).fit(X, y)
     assert_almost_equal(gpr.y_train_mean_, 0)
     assert_almost_equal(gpr.y_train_std_, 1)
+
+
+@pytest.mark.fast_test
+@pytest.mark.parametrize("kernel", [kernel1, kernel2, kernel3])
+def test_std_equals_sqrt_cov_diagonal(kernel):
+    X_test = rng.randn(20, 5)
+    gpr = GaussianProcessRegressor(kernel, noise="gaussian").fit(X, y)
+    _, std = gpr.predict(X_test, return_std=True)
+    _, cov = gpr.predict(X_test, return_cov=True)
+    assert_array_almost_equal(std, np.sqrt(np.diag(cov)))
+
+
+@pytest.mark.fast_test
+def test_predict_std_bo_fit():
+    # A fit as in Bayesian optimization: a smooth function, the default
+    # estimator and many candidate points, some far from any observation
+    # and some with a standard deviation close to zero
+    rs = np.random.RandomState(0)
+    X_train = rs.rand(30, 2)
+    y_train = np.sin(3 * X_train[:, 0]) + np.cos(2 * X_train[:, 1])
+    X_test = rs.rand(10000, 2)
+    gpr = cook_estimator("GP", space=[(0., 1.)] * 2, noise="gaussian",
+                         random_state=1).fit(X_train, y_train)
+    mean, std = gpr.predict(X_test, return_std=True)
+
+    # reference from a triangular solve with the Cholesky factor
+    K_trans = gpr.kernel_(X_test, gpr.X_train_)
+    v = solve_triangular(gpr.L_, K_trans.T, lower=True)
+    var = gpr.kernel_.diag(X_test) - np.einsum("ij,ij->j", v, v)
+    std_ref = np.sqrt(np.clip(var, 0, None)) * gpr.y_train_std_
+    assert_allclose(std, std_ref, rtol=1e-4)
+
+    # the expected improvement is largest at the same candidate
+    def ei(std):
+        improve = np.min(y_train) - mean
+        scaled = improve / std
+        return improve * norm.cdf(scaled) + std * norm.pdf(scaled)
+
+    assert np.argmax(ei(std)) == np.argmax(ei(std_ref))
+
+
+@pytest.mark.fast_test
+@pytest.mark.parametrize("noise", ["gaussian", 1e-3, None])
+def test_incremental_fit(noise):
+    X = rng.rand(20, 3)
+    y = np.sin(4 * X.sum(axis=1))
+    X_test = rng.rand(10, 3)
+    kwargs = dict(kernel=Matern(length_scale=0.5), noise=noise, alpha=1e-6,
+                  normalize_y=True, optimizer=None)
+    gpr = GaussianProcessRegressor(**kwargs).fit(X, y)
+
+    gpr_inc = GaussianProcessRegressor(incremental=True, **kwargs)
+    for n in [5, 6, 15, 20]:
+        gpr_inc.fit(X[:n], y[:n])
+    mean, std = gpr.predict(X_test, return_std=True)
+    mean_inc, std_inc = gpr_inc.predict(X_test, return_std=True)
+    assert_array_almost_equal(mean, mean_inc)
+    assert_array_almost_equal(std, std_inc)
+    assert_array_almost_equal(gpr.K_inv_, gpr_inc.K_inv_)
+    assert_almost_equal(gpr.log_marginal_likelihood_value_,
+                        gpr_inc.log_marginal_likelihood_value_)
+    # fitting the same instance again does not add the noise twice
+    assert gpr_inc.kernel == gpr.kernel
+
+
+@pytest.mark.fast_test
+@pytest.mark.parametrize("incremental", [False, True])
+def test_hyperparam_refit_every(incremental):
+    X = rng.rand(20, 3)
+    y = np.sin(4 * X.sum(axis=1))
+    X_test = rng.rand(10, 3)
+    gpr = GaussianProcessRegressor(kernel=Matern(), noise="gaussian",
+                                   normalize_y=True, incremental=incremental,
+                                   hyperparam_refit_every=3)
+    thetas = []
+    for n in [5, 6, 7, 20]:
+        gpr.fit(X[:n], y[:n])
+        thetas.append(gpr.kernel_.theta)
+    # the second and third fits keep the hyperparameters of the first one
+    assert_array_almost_equal(thetas[0], thetas[1])
+    assert_array_almost_equal(thetas[0], thetas[2])
+    assert np.any(thetas[0] != thetas[3])
+
+    gpr.fit(X, y)
+    gpr_fixed = GaussianProcessRegressor(kernel=gpr._kernel_train,
+                                         normalize_y=True, optimizer=None)
+    gpr_fixed.fit(X, y)
+    assert_array_almost_equal(gpr.predict(X_test),
+                              gpr_fixed.predict(X_test))
+    assert_array_almost_equal(gpr.K_inv_, gpr_fixed.K_inv_)
+
+
+@pytest.mark.fast_test
+@pytest.mark.parametrize("kernel", [ConstantKernel(2.0) * Matern(nu=2.5),
+                                    Matern(length_scale=[1, 2, 3, 4, 5],
+                                           nu=1.5),
+                                    Matern(nu=0.5) * ConstantKernel(),
+                                    RBF(), kernel2])
+def test_use_numba(kernel):
+    pytest.importorskip("numba")
+    X_test = rng.randn(20, 5)
+    gpr = GaussianProcessRegressor(kernel, noise="gaussian").fit(X, y)
+    gpr_numba = GaussianProcessRegressor(
+        kernel, noise="gaussian", use_numba=True).fit(X, y)
+    # sums of non-white kernels are not specialized
+    assert (gpr_numba._kernel_cross_params is None) == (kernel is kernel2)
+    mean, std = gpr.predict(X_test, return_std=True)
+    mean_numba, std_numba = gpr_numba.predict(X_test, return_std=True)
+    assert_array_almost_equal(mean, mean_numba)
+    assert_array_almost_equal(std, std_numba)
+    # a single point uses the serial loop
+    assert_array_almost_equal(mean[:1], gpr_numba.predict(X_test[:1]))
+
+    gpr_pickled = pickle.loads(pickle.dumps(gpr_numba))
+    assert_array_equal(mean_numba, gpr_pickled.predict(X_test))
+
+
+@pytest.mark.fast_test
+def test_use_numba_threads(monkeypatch):
+    pytest.importorskip("numba")
+    from ProcessOptimizer.learning.gaussian_process import gp_specialize
+
+    # Entering the parallel loop from several threads at once, as in the
+    # restarts of the lbfgs acquisition optimizer, aborts the process with
+    # numba's default threading layer. Record who enters it.
+    callers = []
+    matern_cross = gp_specialize._matern_cross
+
+    def recording_matern_cross(*args):
+        callers.append(threading.current_thread())
+        return matern_cross(*args)
+
+    monkeypatch.setattr(gp_specialize, "_matern_cross",
+                        recording_matern_cross)
+
+    X_test = rng.randn(200, 5)
+    gpr = GaussianProcessRegressor(Matern(nu=2.5), noise="gaussian",
+                                   use_numba=True).fit(X, y)
+    mean = gpr.predict(X_test)
+    assert callers == [threading.main_thread()]
+    assert_array_almost_equal(mean[:1], gpr.predict(X_test[:1]))
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        means = list(executor.map(gpr.predict, [X_test] * 8))
+    for mean_thread in means:
+        assert_array_almost_equal(mean, mean_thread)
+    # neither the single point nor the other threads used the parallel loop
+    assert callers == [threading.main_thread()]
@@ -13,6 +13,10 @@ from ProcessOptimizer.benchmarks import branin
 from ProcessOptimizer.learning import ExtraTreesRegressor, RandomForestRegressor
 from ProcessOptimizer.learning import GradientBoostingQuantileRegressor
 from ProcessOptimizer.optimizer import Optimizer
+from ProcessOptimizer.optimizer.optimizer import _boltzmann_restart_points
+from ProcessOptimizer.optimizer.optimizer import _pruned_acquisition
+from ProcessOptimizer.acquisition import _gaussian_acquisition
+from ProcessOptimizer.utils import cook_estimator
 from scipy.optimize import OptimizeResult
 
 
@@ -206,6 +210,51 @@ def test_optimizer_copy(acq_func):
     assert_array_equal(opt_copy.yi, opt.yi)
 
 
+@pytest.mark.fast_test
+@pytest.mark.parametrize("lhs", [True, False])
+def test_optimizer_copy_lhs(lhs):
+    opt = Optimizer([(-2.0, 2.0), (0, 10)], "GP", n_initial_points=5,
+                    lhs=lhs, random_state=1)
+    # copying does not draw from the random state it is given, as in
+    # `update_next`
+    state = opt.rng.get_state()
+    opt_copy = opt.copy(random_state=opt.rng)
+    assert_equal(opt.rng.get_state(), state)
+    assert opt_copy._lhs == lhs
+    if lhs:
+        assert opt_copy._lhs_samples == opt._lhs_samples
+
+
+@pytest.mark.fast_test
+def test_invalid_candidate_sampler():
+    with pytest.raises(ValueError) as e:
+        Optimizer([(-2.0, 2.0)], acq_optimizer_kwargs={
+            "candidate_sampler": "halton"})
+    assert "candidate_sampler" in str(e.value)
+
+
+@pytest.mark.fast_test
+@pytest.mark.parametrize("offset", [0.0, 5.0])
+def test_boltzmann_restart_points(offset):
+    rng = np.random.RandomState(1)
+    X = rng.uniform(size=(100, 2))
+    # Negative values for EI-like acquisitions, shifted for LCB-like ones
+    values = -rng.uniform(size=100) + offset
+    x0 = _boltzmann_restart_points(X, values, 5, rng)
+    assert x0.shape == (5, 2)
+    assert len(np.unique(x0, axis=0)) == 5
+    assert_array_equal(x0[-1], X[np.argmin(values)])
+
+
+@pytest.mark.fast_test
+def test_boltzmann_restart_points_few_candidates():
+    rng = np.random.RandomState(1)
+    X = np.array([[0.1], [0.2]])
+    x0 = _boltzmann_restart_points(X, [-1.0, 0.0], 5, rng)
+    assert x0.shape == (2, 1)
+    assert_array_equal(x0[-1], [0.1])
+
+
 @pytest.mark.parametrize("base_estimator", ESTIMATOR_STRINGS)
 def test_exhaust_initial_calls(base_estimator):
     # check a model is fitted and used to make suggestions after we added
@@ -329,3 +378,56 @@ def test_iterating_ask_tell_lhs():
     assert opt.ask(n_points=3) == samples[2:5]  # samples 2,3 and 4
     opt.tell([[2], [2], [2]], [0, 0, 0])
     assert opt.ask() == samples[5]  # sample 5
+
+
+@pytest.mark.fast_test
+def test_gp_hedge_state():
+    # the proposals of the three acquisition functions are kept as the rows
+    # of a single array and the gains are updated with one batched predict
+    opt = Optimizer([(-2.0, 2.0), (-1.0, 1.0)], "GP", n_initial_points=2,
+                    acq_func="gp_hedge", acq_optimizer="sampling",
+                    random_state=1)
+    opt.run(branin, n_iter=4)
+    assert_equal(opt.next_xs_.shape, (3, 2))
+    assert_equal(opt.gains_.shape, (3,))
+    assert np.all(np.isfinite(opt.gains_))
+    assert np.any(opt.gains_ != 0)
+
+
+@pytest.mark.fast_test
+def test_transformed_Xi():
+    opt = Optimizer([(-2.0, 2.0), ["a", "b", "c"]], "GP", n_initial_points=2,
+                    acq_optimizer="sampling", random_state=1)
+    for i in range(5):
+        x = opt.ask()
+        opt.tell(x, float(i))
+        Xt = opt._transformed_Xi()
+        assert Xt.flags["C_CONTIGUOUS"]
+        assert_array_equal(Xt, opt.space.transform(opt.Xi))
+
+    # points added directly to Xi are picked up, and a shorter Xi causes
+    # the buffer to be rebuilt
+    opt.Xi.append([0.5, "c"])
+    assert_array_equal(opt._transformed_Xi(), opt.space.transform(opt.Xi))
+    opt.Xi = opt.Xi[:2]
+    assert_array_equal(opt._transformed_Xi(), opt.space.transform(opt.Xi))
+
+
+@pytest.mark.fast_test
+@pytest.mark.parametrize("acq_func", ["EI", "PI", "LCB"])
+def test_pruned_acquisition(acq_func):
+    rng = np.random.RandomState(0)
+    X = rng.rand(30, 2)
+    y = np.sin(3 * X.sum(axis=1)) + np.sum(X ** 2, axis=1)
+    gpr = cook_estimator("GP", space=[(0.0, 1.0)] * 2, random_state=0)
+    gpr.fit(X, y)
+    X_cand = rng.rand(2000, 2)
+
+    values = _gaussian_acquisition(X_cand, gpr, np.min(y), acq_func)
+    pruned = _pruned_acquisition(X_cand, gpr, np.min(y), [acq_func],
+                                 None, n_best=5)[0]
+    best = np.argsort(values)[:5]
+    assert_array_equal(np.argsort(pruned)[:5], best)
+    np.testing.assert_allclose(pruned[best], values[best])
+    # the values of the pruned points are optimistic bounds
+    assert np.all(pruned <= values + 1e-8)
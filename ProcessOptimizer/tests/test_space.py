@@ -687,3 +687,45 @@ def test_lhs():
     samples = SPACE.lhs(10)
     assert len(samples) == 10
     assert len(samples[0]) == 3
+
+
+@pytest.mark.fast_test
+def test_lhs_random_state():
+    SPACE = Space([Integer(0, 9), Real(0, 10)])
+    samples = SPACE.lhs(10, random_state=1)
+    assert samples == SPACE.lhs(10, random_state=1)
+    assert samples != SPACE.lhs(10, random_state=2)
+    # Each dimension is still a permutation of the evenly spaced values
+    assert sorted(s[0] for s in samples) == list(range(10))
+    assert_array_almost_equal(sorted(s[1] for s in samples),
+                              SPACE.dimensions[1].lhs_arange(10))
+
+
+@pytest.mark.fast_test
+def test_sobol():
+    SPACE = Space(
+        [Integer(-20, 20), Real(1e-3, 10, prior="log-uniform"),
+         Categorical(list("abc"))]
+    )
+    samples = SPACE.sobol(16, random_state=1)
+    assert len(samples) == 16
+    assert len(samples[0]) == 3
+    assert all(sample in SPACE for sample in samples)
+    assert_equal(samples, SPACE.sobol(16, random_state=1))
+
+
+@pytest.mark.fast_test
+@pytest.mark.parametrize("sampler", ["random", "sobol"])
+def test_rvs_transformed(sampler):
+    SPACE = Space(
+        [Integer(-20, 20), Real(1e-3, 10, prior="log-uniform"),
+         Categorical(list("abc")), Categorical(["x", "y"])]
+    )
+    if sampler == "sobol":
+        samples = SPACE.sobol(20, random_state=1)
+    else:
+        samples = SPACE.rvs(20, random_state=1)
+    Xt = SPACE.rvs_transformed(20, random_state=1, sampler=sampler)
+    assert Xt.dtype == np.float64
+    assert Xt.flags["C_CONTIGUOUS"]
+    assert_array_equal(Xt, SPACE.transform(samples))
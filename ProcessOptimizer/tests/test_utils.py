@@ -211,6 +211,21 @@ def test_categorical_gp_has_gradients():
     assert not has_gradients(cook_estimator('GP', space=space))
 
 
+@pytest.mark.fast_test
+@pytest.mark.parametrize("dimensions",
+                         [((1., 3.), (1, 3)),
+                          ((1., 3.), ('a', 'b', 'c'), ('x', 'y')),
+                          (('a', 'b', 'c'), ('x', 'y')),
+                          ((1., 3.), Categorical(['a', 'b', 'c'],
+                                                 transform='identity')),
+                          ])
+def test_cook_estimator_gp_length_scales(dimensions):
+    # one length scale per dimension of the normalized space
+    gpr = cook_estimator('GP', space=Space(dimensions))
+    n_dims = normalize_dimensions(dimensions).transformed_n_dims
+    assert np.size(gpr.kernel.k2.length_scale) == n_dims
+
+
 @pytest.mark.fast_test
 def test_normalize_dimensions_all_categorical():
     dimensions = (['a', 'b', 'c'], ['1', '2', '3'])
@@ -252,6 +267,23 @@ def test_normalize_dimensions_name(dimension, name):
     assert space.dimensions[0].name == name
 
 
+@pytest.mark.fast_test
+def test_normalize_dimensions_cached():
+    dimensions = [(1, 3), (1e-3, 1.0, "log-uniform"), ["a", "b"],
+                  Real(1, 2, name="x")]
+    space = normalize_dimensions(dimensions)
+    space_cached = normalize_dimensions(list(dimensions))
+    assert space == space_cached
+    # spaces are mutable, so the cached space is not shared
+    assert space is not space_cached
+    assert space.dimensions[0] is not space_cached.dimensions[0]
+    # integer and real bounds are distinguished
+    assert isinstance(normalize_dimensions([(1, 3)]).dimensions[0], Integer)
+    assert isinstance(normalize_dimensions([(1., 3.)]).dimensions[0], Real)
+    assert normalize_dimensions([Real(1, 2, name="y")]).dimensions[0].name \
+        == "y"
+
+
 @pytest.mark.fast_test
 def test_use_named_args():
     """
@@ -1,4 +1,5 @@
 from copy import deepcopy
+from functools import lru_cache
 from functools import wraps
 
 import numpy as np
@@ -443,9 +444,17 @@ def cook_estimator(base_estimator,
     if base_estimator == "GP":
         if space is not None:
             space = Space(space)
-            space = Space(normalize_dimensions(space.dimensions))
-            n_dims = space.transformed_n_dims
             is_cat = space.is_categorical
+            # The sizes the dimensions get in `normalize_dimensions(space)`,
+            # without building that space. It only changes the transform
+            # of numerical dimensions, which have size 1 either way, and
+            # sets all dimensions of a fully categorical space to size 1.
+            if is_cat:
+                transformed_sizes = [1] * space.n_dims
+            else:
+                transformed_sizes = [
+                    dim.transformed_size for dim in space.dimensions]
+            n_dims = sum(transformed_sizes)
 
         else:
             raise ValueError("Expected a Space instance, not None.")
@@ -461,7 +470,7 @@ def cook_estimator(base_estimator,
         length_scale_bounds_transformed = []
         length_scale_transformed = []
         for i in range(len(space.dimensions)):
-            for j in range(space.dimensions[i].transformed_size):
+            for j in range(transformed_sizes[i]):
                 length_scale_bounds_transformed.append(length_scale_bounds[i])
                 length_scale_transformed.append(length_scale[i])
 
@@ -612,6 +621,56 @@ def normalize_dimensions(dimensions):
          NOTE: The upper and lower bounds are inclusive for `Integer`
          dimensions.
     """
+    # Creating the dimensions, and the scipy distributions they hold, is
+    # the expensive part, so spaces are cached on the attributes that
+    # define the dimensions. A copy is returned, as spaces are mutable.
+    try:
+        key = _DimensionsKey(dimensions)
+    except TypeError:
+        return _normalize_dimensions(dimensions)
+    return deepcopy(_normalize_dimensions_cached(key))
+
+
+def _dimension_key(dimension):
+    """Hashable description of a dimension, or of a dimension given as a
+    tuple or list. The types of the values are included, so that `(1, 10)`
+    and `(1.0, 10.0)` do not share a key."""
+    if isinstance(dimension, Dimension):
+        prior = getattr(dimension, "prior", None)
+        if isinstance(prior, (list, np.ndarray)):
+            prior = tuple(prior)
+        return (type(dimension).__name__,
+                getattr(dimension, "low", None),
+                getattr(dimension, "high", None),
+                prior,
+                tuple(getattr(dimension, "categories", ())),
+                dimension.name,
+                dimension.transform_)
+    return (type(dimension).__name__,
+            tuple((type(value).__name__, value) for value in dimension))
+
+
+class _DimensionsKey(object):
+    """Cache key for `normalize_dimensions`, which keeps a reference to the
+    dimensions so that the space can be created on a cache miss."""
+    def __init__(self, dimensions):
+        self.dimensions = dimensions
+        self.key = tuple(_dimension_key(dim) for dim in dimensions)
+        self._hash = hash(self.key)
+
+    def __hash__(self):
+        return self._hash
+
+    def __eq__(self, other):
+        return self.key == other.key
+
+
+@lru_cache(maxsize=16)
+def _normalize_dimensions_cached(key):
+    return _normalize_dimensions(key.dimensions)
+
+
+def _normalize_dimensions(dimensions):
     space = Space(dimensions)
     transformed_dimensions = []
     if space.is_categorical:
@@ -22,10 +22,11 @@ setup(name='ProcessOptimizer',
           'ProcessOptimizer.space',
           'ProcessOptimizer.learning.gaussian_process'
           ],
-      install_requires=['numpy', 'matplotlib', 'scipy',
+      install_requires=['numpy', 'matplotlib', 'scipy>=1.7',
                         'scikit-learn>=0.24.2', 'six', 'deap', 'pyYAML'],
       extras_require={
-          "bokeh": ['bokeh', 'tornado']
+          "bokeh": ['bokeh', 'tornado'],
+          "numba": ['numba']
           },
       long_description=long_description,
       long_description_content_type='text/markdown'